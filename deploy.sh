@@ -26,11 +26,15 @@ echo "Step 1: Validating template..."
 sam validate --lint
 
 echo ""
-echo "Step 2: Building application..."
+echo "Step 2: Compiling account configuration..."
+python3 scripts/compile_accounts.py
+
+echo ""
+echo "Step 3: Building application..."
 sam build
 
 echo ""
-echo "Step 3: Deploying to AWS..."
+echo "Step 4: Deploying to AWS..."
 
 # Check if this is first deployment
 if [ "$1" == "--guided" ]; then
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Compile the account configuration from YAML to JSON.
+
+The Lambda prefers config/accounts.json when it is at least as new as
+config/accounts.yaml, which keeps YAML parsing off the cold-start path.
+Run this before `sam build` (deploy.sh does it for you).
+
+Usage:
+    python scripts/compile_accounts.py [source.yaml] [dest.json]
+"""
+import sys
+import json
+from pathlib import Path
+
+import yaml
+
+
+def compile_accounts(source: Path, dest: Path) -> int:
+    """Convert an accounts YAML file to JSON.
+
+    Args:
+        source: Path to the YAML file
+        dest: Path of the JSON file to write
+
+    Returns:
+        Number of accounts written
+    """
+    with open(source, 'r') as f:
+        data = yaml.safe_load(f)
+
+    if not isinstance(data, dict) or not isinstance(data.get('accounts'), list):
+        raise ValueError(f"{source} must contain an 'accounts' list")
+
+    with open(dest, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+    return len(data['accounts'])
+
+
+def main() -> None:
+    root = Path(__file__).parent.parent
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else root / 'config' / 'accounts.yaml'
+    dest = Path(sys.argv[2]) if len(sys.argv) > 2 else source.with_suffix('.json')
+
+    count = compile_accounts(source, dest)
+    print(f"Compiled {count} accounts: {source} -> {dest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,28 +1,202 @@
 """Claude AI client for article summarization."""
+import json
+import time
+import hashlib
+import functools
+import unicodedata
 import anthropic
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from src.constants import (
     CLAUDE_MAX_TOKENS,
     CLAUDE_TEMPERATURE,
     CLAUDE_REQUEST_TIMEOUT,
+    CLAUDE_MAX_CONCURRENCY,
+    CLAUDE_BATCH_MIN_REQUESTS,
+    CLAUDE_BATCH_POLL_INTERVAL,
+    CLAUDE_BATCH_MAX_WAIT,
+    CLAUDE_BATCH_CANCEL_WAIT,
+    CLAUDE_COMBINED_MAX_ACCOUNTS,
+    CLAUDE_COMBINED_MAX_CHARS,
     MAX_DESCRIPTION_LENGTH,
 )
 from src.utils.logging_config import get_logger
+from src.utils.summary_cache import SummaryCache
 
 logger = get_logger(__name__)
 
+# Per-company block that follows the cached instructions
+_ARTICLES_TEMPLATE = (
+    "**Company:** {company}\n\n"
+    "**Articles about {company}:**\n\n"
+    "{articles_text}\n\n"
+    "**Now generate the brief:**"
+)
+
+# Preamble for combined calls that brief several companies at once
+_COMBINED_PREAMBLE = (
+    "This request covers several companies. Write one separate brief per "
+    "company, following the instructions above and using only that company's "
+    "articles. Respond with only a JSON object of the form "
+    "{\"summaries\": [{\"company\": \"<company name exactly as given>\", "
+    "\"summary\": \"<the brief>\"}]}, with one entry per company in the order given."
+)
+
+# Per-company block within a combined call
+_COMBINED_COMPANY_TEMPLATE = (
+    "### Company {number}\n\n"
+    "**Company:** {company}\n\n"
+    "**Articles about {company}:**\n\n"
+    "{articles_text}"
+)
+
+# Bump whenever the prompt text changes so cached summaries are invalidated
+PROMPT_VERSION = 1
+
+# Display format for article publication dates
+_DATE_FMT = '%b %d, %Y'
+
+# Descriptions longer than MAX_DESCRIPTION_LENGTH are cut here and get '...'
+_MAX_DESC_TRUNC = MAX_DESCRIPTION_LENGTH - 3
+
+
+# Static instructions shared by every company in a run. This block is sent
+# first with cache_control so Anthropic can serve it from the prompt cache; it
+# must stay free of per-company text and above the model's minimum cacheable
+# prefix length (1024 tokens for Sonnet).
+PROMPT_INSTRUCTIONS = """You are generating a weekly sales intelligence brief for account executives. You will summarize recent news about the company named after these instructions, based only on the articles listed with it.
+
+**Audience and purpose:**
+The readers are B2B account executives (AEs) who own the relationship with this company. They will skim the brief on Monday morning, usually minutes before a call, to learn what changed at the account during the past week and how to open a relevant conversation. Every line should help an AE sound informed, spot a buying signal, or avoid an awkward misstep.
+
+**Instructions:**
+1. Group the information into these exact sections (only include sections that have content):
+   - **Products/Launches**: New products, features, or services
+   - **Customers/Partners**: New customers, partnerships, integrations, or case studies
+   - **Exec & Hiring**: Leadership changes, key hires, organizational announcements
+   - **Funding/M&A**: Funding rounds, acquisitions, or financial milestones
+   - **Risks/Controversies**: Lawsuits, security incidents, outages, or negative press
+   - **Regulatory**: Compliance updates, policy changes, or regulatory filings
+
+2. For each section:
+   - Write 1-3 concise bullets
+   - Keep each bullet under 25 words
+   - Include concrete numbers, dates, and names when available
+   - Focus on what matters to an AE preparing for a call
+
+3. End with a section called **Talk track:** containing 2 bullets that suggest conversation starters or angles for an AE
+
+4. If there's no material news in a category, skip that section entirely
+
+**Section guidance:**
+- **Products/Launches**: General availability, public previews, major version releases, pricing or packaging changes, new regions, and retired products. Name the product and say who it is for. Skip minor feature updates unless they clearly change what the company sells.
+- **Customers/Partners**: Named customer wins, expanded deployments, strategic alliances, marketplace listings, resellers, technology integrations, and published case studies. Name the counterparty and, when stated, the scale of the deal.
+- **Exec & Hiring**: C-suite and VP-level appointments or departures, board changes, reorganizations, layoffs, hiring sprees, and new offices. Give the person's name and title; note a predecessor when the article mentions one.
+- **Funding/M&A**: Funding rounds with amount, lead investor, and valuation when disclosed; acquisitions made or received; divestitures; IPO filings; and reported quarterly results or guidance changes.
+- **Risks/Controversies**: Litigation, data breaches, service outages, product recalls, activist investors, boycotts, and critical investigative reporting. State the facts neutrally and avoid speculation about outcomes.
+- **Regulatory**: Government investigations, fines, certifications such as FedRAMP, SOC 2, or ISO 27001, export controls, privacy rulings, and new laws the company says will affect its business.
+
+**Writing rules:**
+- Use only facts stated in the provided articles. Never invent figures, names, dates, or quotes, and never draw on outside knowledge about the company.
+- When several articles cover the same event, merge them into a single bullet instead of repeating it.
+- Prefer the most recent and most authoritative source when articles disagree, and mention the disagreement only if it matters to a sales conversation.
+- Lead each bullet with the concrete fact, not with filler such as "The company announced that".
+- Write dates as "Mon DD" (for example "Mar 04") and money as "$25M" or "$1.2B".
+- Do not include URLs, article numbers, or source names in the bullets; links are attached separately.
+- Ignore articles that are not actually about the named company, such as stock-price roundups, listicles, or pieces where it is only mentioned in passing.
+- If none of the articles contain material news, reply with exactly "**No material items this week.**" and nothing else.
+
+**Prioritization:**
+- Order bullets within a section from most to least important for an upcoming sales conversation.
+- Rank news that signals budget, new initiatives, leadership turnover, or changing vendor relationships above routine marketing announcements.
+- Treat official press releases as authoritative for what was announced, and independent reporting as authoritative for reactions and consequences.
+- If the articles only cover minor items, it is fine for the brief to contain a single short section plus the talk track.
+
+**Talk track rules:**
+- Each talk-track bullet should tie a specific item from the brief to a likely business priority of the account.
+- Phrase it as an angle or an open question the AE could use, not as a pitch for any particular product.
+- Keep both bullets under 30 words and avoid repeating the same item twice.
+- Never suggest raising a lawsuit, layoff, or security incident in a way that could come across as insensitive; frame such items as context to be aware of.
+
+**Output format:**
+- Use Slack-compatible markdown: section titles in bold on their own line, followed by bullets that start with "• ".
+- Leave one blank line between sections.
+- Do not add a title, greeting, preamble, or closing remarks; start directly with the first section."""
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date_cached(pub_date: str) -> str:
+    """Parse and format a non-empty publication date, memoized per input string.
+
+    Args:
+        pub_date: ISO date string
+
+    Returns:
+        Formatted date string
+    """
+    if len(pub_date) < 10:
+        return pub_date
+
+    try:
+        if pub_date.endswith('Z'):
+            pub_date_iso = pub_date[:-1] + '+00:00'
+        else:
+            pub_date_iso = pub_date
+        return datetime.fromisoformat(pub_date_iso).strftime(_DATE_FMT)
+    except ValueError as e:
+        logger.warning(f"Failed to parse date '{pub_date}': {e}")
+        return pub_date[:10]
+
+
+@dataclass(slots=True)
+class ArticlesView:
+    """Column-oriented view of a list of article dictionaries.
+
+    Built in a single pass so prompt building, link formatting, and cache
+    keys read plain parallel lists instead of repeating dict lookups.
+    """
+    titles: List[str]
+    sources: List[str]
+    links: List[str]
+    pubdates: List[str]
+    descriptions: List[str]
+
+    @classmethod
+    def from_dicts(cls, articles: List[Dict]) -> 'ArticlesView':
+        """Create an ArticlesView from article dictionaries.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            ArticlesView instance
+        """
+        view = cls([], [], [], [], [])
+        for article in articles:
+            view.titles.append(article.get('title', 'No title'))
+            view.sources.append(article.get('source_name', 'Unknown source'))
+            view.links.append(article.get('link', ''))
+            view.pubdates.append(article.get('pubDate', ''))
+            view.descriptions.append(article.get('description', ''))
+        return view
+
+    def __len__(self) -> int:
+        return len(self.links)
+
 
 class ClaudeClient:
     """Client for summarizing articles using Claude AI."""
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, cache: Optional[SummaryCache] = None):
         """Initialize the Claude client.
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            cache: Optional cache for previously generated summaries
         """
         if not api_key:
             raise ValueError("API key cannot be empty")
@@ -32,6 +206,7 @@ class ClaudeClient:
             timeout=CLAUDE_REQUEST_TIMEOUT
         )
         self.model = model
+        self.cache = cache
 
     def summarize_articles(
         self,
@@ -47,6 +222,8 @@ class ClaudeClient:
         Returns:
             Dictionary with summary sections and metadata
         """
+        articles = self._dedupe_articles(articles)
+
         if not articles:
             logger.info(f"[{company}] No articles to summarize")
             return {
@@ -57,8 +234,14 @@ class ClaudeClient:
                 'tokens_used': 0
             }
 
-        # Build the prompt
-        prompt = self._build_prompt(company, articles)
+        view = ArticlesView.from_dicts(articles)
+
+        cached = self._get_cached(company, view)
+        if cached:
+            return cached
+
+        # Build the prompt content blocks
+        prompt = self._build_prompt(company, view)
 
         try:
             # Call Claude API
@@ -74,107 +257,508 @@ class ClaudeClient:
                 ]
             )
 
-            # Fix: Validate response structure
-            if not message or not hasattr(message, 'content'):
-                logger.error(f"[{company}] Invalid response from Claude API")
-                return self._error_response(company, articles, "Invalid API response")
+            result = self._parse_message(company, view, message)
+            self._store_cached(company, view, result)
+            return result
+
+        except anthropic.APIError as e:
+            logger.error(f"[{company}] Claude API error: {e}")
+            return self._error_response(company, view, f"API error: {str(e)}")
+        except Exception as e:
+            logger.error(f"[{company}] Unexpected error during summarization: {e}")
+            return self._error_response(company, view, f"Unexpected error: {str(e)}")
 
-            if not message.content or len(message.content) == 0:
-                logger.error(f"[{company}] Empty content in Claude response")
-                return self._error_response(company, articles, "Empty response content")
+    def summarize_many(
+        self,
+        companies_articles: List[Tuple[str, List[Dict]]],
+        max_workers: int = CLAUDE_MAX_CONCURRENCY
+    ) -> List[Dict]:
+        """Summarize several companies concurrently.
 
-            # Extract the summary text
-            summary_text = message.content[0].text
+        Each summarization is a network-bound API call, so running them in a
+        thread pool makes the total wall time roughly that of the slowest call
+        instead of the sum of all of them.
 
-            # Format links
-            links = self._format_links(articles)
+        Args:
+            companies_articles: List of (company, articles) pairs
+            max_workers: Maximum number of concurrent API calls
 
-            tokens_used = message.usage.input_tokens + message.usage.output_tokens
-            logger.info(f"[{company}] Summarization complete. Tokens used: {tokens_used}")
+        Returns:
+            List of summary dictionaries in the same order as the input
+        """
+        if not companies_articles:
+            return []
+
+        workers = max(1, min(max_workers, len(companies_articles)))
+        logger.info(f"Summarizing {len(companies_articles)} companies with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.summarize_articles, company, articles)
+                for company, articles in companies_articles
+            ]
+
+            results = []
+            for (company, articles), future in zip(companies_articles, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"[{company}] Unexpected error during summarization: {e}")
+                    results.append(self._error_response(
+                        company, ArticlesView.from_dicts(articles), f"Unexpected error: {str(e)}"
+                    ))
+
+        return results
+
+    def summarize_articles_batch(
+        self,
+        jobs: List[Tuple[str, List[Dict]]],
+        deadline: Optional[float] = None
+    ) -> List[Dict]:
+        """Summarize several companies with the Message Batches API.
+
+        Batches are billed at half the per-call rate but may take minutes to
+        complete. Small runs fall back to concurrent per-call summarization.
+        A batch that does not finish within CLAUDE_BATCH_MAX_WAIT (or in
+        time to leave CLAUDE_REQUEST_TIMEOUT before the deadline) is
+        cancelled; its finished requests are kept and only the companies
+        without a result are summarized per call.
 
-            return {
+        Args:
+            jobs: List of (company, articles) pairs
+            deadline: time.monotonic() value by which summaries must be
+                returned; companies still unsummarized when there is no
+                time left for a per-call request get an error summary
+
+        Returns:
+            List of summary dictionaries in the same order as the input
+        """
+        # Latest time a per-call fallback request may start
+        fallback_by = deadline - CLAUDE_REQUEST_TIMEOUT if deadline is not None else float('inf')
+
+        jobs = [(company, self._dedupe_articles(articles)) for company, articles in jobs]
+        views = [ArticlesView.from_dicts(articles) for _, articles in jobs]
+
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        for idx, (company, articles) in enumerate(jobs):
+            if articles:
+                results[idx] = self._get_cached(company, views[idx])
+
+        pending = [idx for idx, (_, articles) in enumerate(jobs) if articles and results[idx] is None]
+        if len(pending) < CLAUDE_BATCH_MIN_REQUESTS:
+            logger.info(f"Only {len(pending)} companies to summarize, skipping batch API")
+            return self.summarize_many(jobs)
+        if time.monotonic() + CLAUDE_BATCH_CANCEL_WAIT + CLAUDE_BATCH_POLL_INTERVAL >= fallback_by:
+            logger.warning("Not enough time left to wait for a batch, skipping batch API")
+            return self.summarize_many(jobs)
+
+        # Company names may contain characters custom_id does not allow
+        requests = []
+        for idx in pending:
+            company = jobs[idx][0]
+            requests.append({
+                "custom_id": f"job-{idx}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": CLAUDE_MAX_TOKENS,
+                    "temperature": CLAUDE_TEMPERATURE,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": self._build_prompt(company, views[idx])
+                        }
+                    ]
+                }
+            })
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted summarization batch {batch.id} with {len(requests)} requests")
+
+            # Stop waiting early enough to cancel, collect the results, and
+            # still fall back per call (one poll interval covers the calls)
+            stop_by = fallback_by - CLAUDE_BATCH_POLL_INTERVAL
+            wait_until = min(time.monotonic() + CLAUDE_BATCH_MAX_WAIT, stop_by - CLAUDE_BATCH_CANCEL_WAIT)
+            cancelled = False
+            while batch.processing_status != 'ended':
+                now = time.monotonic()
+                if now >= wait_until:
+                    if cancelled:
+                        break
+                    logger.warning(f"Batch {batch.id} did not finish in time, cancelling")
+                    self.client.messages.batches.cancel(batch.id)
+                    # Requests that finished before the cancel still have
+                    # results once the batch ends
+                    cancelled = True
+                    wait_until = min(now + CLAUDE_BATCH_CANCEL_WAIT, stop_by)
+                time.sleep(max(0.0, min(CLAUDE_BATCH_POLL_INTERVAL, wait_until - time.monotonic())))
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            if batch.processing_status == 'ended':
+                for entry in self.client.messages.batches.results(batch.id):
+                    idx = int(entry.custom_id.split('-', 1)[1])
+                    company, view = jobs[idx][0], views[idx]
+                    if entry.result.type == 'succeeded':
+                        results[idx] = self._parse_message(company, view, entry.result.message)
+                        self._store_cached(company, view, results[idx])
+                    elif entry.result.type == 'errored':
+                        logger.error(f"[{company}] Batch request {entry.result.type}")
+                        results[idx] = self._error_response(company, view, f"Batch request {entry.result.type}")
+                    # Canceled and expired requests are summarized per call below
+            else:
+                logger.warning(f"Batch {batch.id} did not end within {CLAUDE_BATCH_CANCEL_WAIT}s of cancelling")
+
+        except anthropic.APIError as e:
+            logger.error(f"Claude batch API error: {e}. Summarizing companies without a result per call")
+
+        # Companies without articles, or without a batch result, go through
+        # the regular path if there is still time for a request
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing and time.monotonic() >= fallback_by:
+            logger.error(f"No time left to summarize {len(missing)} companies per call")
+            for idx in missing:
+                if jobs[idx][1]:
+                    results[idx] = self._error_response(jobs[idx][0], views[idx], "Summarization timed out")
+            missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            for idx, result in zip(missing, self.summarize_many([jobs[idx] for idx in missing])):
+                results[idx] = result
+
+        return results
+
+    def summarize_accounts_batch(
+        self,
+        jobs: List[Tuple[str, List[Dict]]]
+    ) -> List[Dict]:
+        """Summarize several companies with as few API calls as possible.
+
+        Companies are packed into combined requests (up to
+        CLAUDE_COMBINED_MAX_ACCOUNTS companies and CLAUDE_COMBINED_MAX_CHARS
+        of article text each) that ask Claude for a JSON list of briefs.
+        Companies a combined call fails to cover go through the per-company
+        path.
+
+        Args:
+            jobs: List of (company, articles) pairs
+
+        Returns:
+            List of summary dictionaries in the same order as the input
+        """
+        jobs = [(company, self._dedupe_articles(articles)) for company, articles in jobs]
+        views = [ArticlesView.from_dicts(articles) for _, articles in jobs]
+
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        texts: Dict[int, str] = {}
+        for idx, (company, articles) in enumerate(jobs):
+            if articles:
+                results[idx] = self._get_cached(company, views[idx])
+                if results[idx] is None:
+                    texts[idx] = self._build_articles_text(views[idx])
+
+        # Pack pending companies into combined requests
+        chunks: List[List[int]] = []
+        size = 0
+        for idx, text in texts.items():
+            if not chunks or len(chunks[-1]) >= CLAUDE_COMBINED_MAX_ACCOUNTS or size + len(text) > CLAUDE_COMBINED_MAX_CHARS:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(idx)
+            size += len(text)
+
+        if chunks:
+            logger.info(f"Summarizing {len(texts)} companies in {len(chunks)} combined requests")
+            workers = max(1, min(CLAUDE_MAX_CONCURRENCY, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._summarize_combined, [(jobs[idx][0], views[idx], texts[idx]) for idx in chunk])
+                    for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures):
+                    for idx, result in zip(chunk, future.result()):
+                        results[idx] = result
+
+        # Empty companies and anything the combined calls missed
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            for idx, result in zip(missing, self.summarize_many([jobs[idx] for idx in missing])):
+                results[idx] = result
+
+        return results
+
+    def _summarize_combined(self, entries: List[Tuple[str, ArticlesView, str]]) -> List[Optional[Dict]]:
+        """Summarize several companies in one API call.
+
+        Args:
+            entries: List of (company, articles view, rendered article text)
+
+        Returns:
+            Summary dictionaries in input order; None where the response did
+            not include a usable brief for that company
+        """
+        companies = ", ".join(company for company, _, _ in entries)
+        sections = [
+            _COMBINED_COMPANY_TEMPLATE.format(number=number, company=company, articles_text=text)
+            for number, (company, _, text) in enumerate(entries, start=1)
+        ]
+        prompt = [
+            {
+                "type": "text",
+                "text": PROMPT_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": _COMBINED_PREAMBLE + "\n\n" + "\n\n".join(sections)
+            }
+        ]
+
+        try:
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=CLAUDE_MAX_TOKENS * len(entries),
+                temperature=CLAUDE_TEMPERATURE,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+            text = message.content[0].text
+            payload = json.loads(text[text.index('{'):text.rindex('}') + 1])
+            briefs = {
+                item['company']: item['summary']
+                for item in payload.get('summaries', [])
+                if isinstance(item, dict) and item.get('company') and item.get('summary')
+            }
+        except anthropic.APIError as e:
+            logger.error(f"[{companies}] Claude API error in combined request: {e}")
+            return [None] * len(entries)
+        except (ValueError, AttributeError, IndexError, TypeError) as e:
+            logger.error(f"[{companies}] Could not parse combined response: {e}")
+            return [None] * len(entries)
+
+        # Usage is reported per call, so split it evenly across the companies
+        usage = message.usage
+        tokens_used = (
+            usage.input_tokens
+            + (getattr(usage, 'cache_read_input_tokens', None) or 0)
+            + (getattr(usage, 'cache_creation_input_tokens', None) or 0)
+            + usage.output_tokens
+        )
+        share = tokens_used // len(entries)
+        logger.info(f"[{companies}] Combined summarization complete. Tokens used: {tokens_used}")
+
+        results: List[Optional[Dict]] = []
+        for company, view, _ in entries:
+            summary_text = briefs.get(company)
+            if summary_text is None:
+                logger.warning(f"[{company}] Missing from combined response")
+                results.append(None)
+                continue
+
+            result = {
                 'company': company,
                 'summary': summary_text,
-                'article_count': len(articles),
-                'links': links,
-                'tokens_used': tokens_used
+                'article_count': len(view),
+                'links': self._format_links(view),
+                'tokens_used': share
             }
+            self._store_cached(company, view, result)
+            results.append(result)
 
-        except anthropic.APIError as e:
-            logger.error(f"[{company}] Claude API error: {e}")
-            return self._error_response(company, articles, f"API error: {str(e)}")
-        except Exception as e:
-            logger.error(f"[{company}] Unexpected error during summarization: {e}")
-            return self._error_response(company, articles, f"Unexpected error: {str(e)}")
+        return results
+
+    def _dedupe_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Drop articles that repeat an earlier one.
 
-    def _build_prompt(self, company: str, articles: List[Dict]) -> str:
-        """Build the prompt for Claude.
+        The Newsdata strategies often return the same story more than once, so
+        articles are keyed by URL without query string, falling back to the
+        normalized title for articles without a link.
 
         Args:
-            company: Company name
             articles: List of article dictionaries
 
         Returns:
-            Formatted prompt string
+            Articles in their original order with duplicates removed
         """
-        # Build article list
-        article_list = []
-        for idx, article in enumerate(articles, 1):
-            title = article.get('title', 'No title')
-            source = article.get('source_name', 'Unknown source')
-            pub_date = article.get('pubDate', '')
-            url = article.get('link', '')
+        seen = set()
+        deduped = []
+        for article in articles:
+            url = (article.get('link') or '').split('?')[0].rstrip('/')
+            if url:
+                key = ('url', url)
+            else:
+                title = unicodedata.normalize('NFKC', article.get('title') or '').strip().lower()
+                if not title:
+                    continue
+                key = ('title', title)
 
-            # Format publication date
-            pub_date_fmt = self._format_date(pub_date)
+            if key not in seen:
+                seen.add(key)
+                deduped.append(article)
 
-            article_list.append(
-                f"{idx}. **{title}**\n"
-                f"   Source: {source} | {pub_date_fmt}\n"
-                f"   URL: {url}"
-            )
+        if len(deduped) < len(articles):
+            logger.info(f"Dropped {len(articles) - len(deduped)} duplicate articles before summarization")
 
-            # Add description if available
-            description = article.get('description', '')
-            if description:
-                # Truncate long descriptions
-                if len(description) > MAX_DESCRIPTION_LENGTH:
-                    description = description[:MAX_DESCRIPTION_LENGTH - 3] + '...'
-                article_list.append(f"   Summary: {description}")
+        return deduped
 
-            article_list.append("")  # Blank line
+    def _cache_key(self, company: str, view: ArticlesView) -> str:
+        """Build a deterministic cache key for a summarization request.
 
-        articles_text = "\n".join(article_list)
+        Args:
+            company: Company name
+            view: Articles to summarize
 
-        # Build the prompt
-        prompt = f"""You are generating a weekly sales intelligence brief for account executives. You will summarize recent news about {company} based on the articles below.
+        Returns:
+            Hex digest identifying the model, company, article set, and prompt version
+        """
+        payload = json.dumps({
+            'model': self.model,
+            'company': company,
+            'links': sorted(view.links),
+            'v': PROMPT_VERSION
+        }, sort_keys=True)
+        return hashlib.blake2b(payload.encode('utf-8')).hexdigest()
 
-**Instructions:**
-1. Group the information into these exact sections (only include sections that have content):
-   - **Products/Launches**: New products, features, or services
-   - **Customers/Partners**: New customers, partnerships, integrations, or case studies
-   - **Exec & Hiring**: Leadership changes, key hires, organizational announcements
-   - **Funding/M&A**: Funding rounds, acquisitions, or financial milestones
-   - **Risks/Controversies**: Lawsuits, security incidents, outages, or negative press
-   - **Regulatory**: Compliance updates, policy changes, or regulatory filings
+    def _get_cached(self, company: str, view: ArticlesView) -> Optional[Dict]:
+        """Return a cached summary for this request, if any.
 
-2. For each section:
-   - Write 1-3 concise bullets
-   - Keep each bullet under 25 words
-   - Include concrete numbers, dates, and names when available
-   - Focus on what matters to an AE preparing for a call
+        Args:
+            company: Company name
+            view: Articles to summarize
 
-3. End with a section called **Talk track:** containing 2 bullets that suggest conversation starters or angles for an AE
+        Returns:
+            Cached summary dictionary or None
+        """
+        if not self.cache:
+            return None
 
-4. If there's no material news in a category, skip that section entirely
+        cached = self.cache.get(self._cache_key(company, view))
+        if cached is None:
+            return None
 
-**Articles about {company}:**
+        logger.info(f"[{company}] Using cached summary")
+        cached['tokens_used'] = 0
+        cached['cached'] = True
+        return cached
 
-{articles_text}
+    def _store_cached(self, company: str, view: ArticlesView, result: Dict) -> None:
+        """Cache a successful summary.
 
-**Now generate the brief:**"""
+        Args:
+            company: Company name
+            view: Articles that were summarized
+            result: Summary dictionary
+        """
+        if self.cache and 'error' not in result:
+            self.cache.set(self._cache_key(company, view), result)
+
+    def _parse_message(self, company: str, view: ArticlesView, message) -> Dict:
+        """Convert a Claude message into a summary dictionary.
+
+        Args:
+            company: Company name
+            view: Articles that were summarized
+            message: Message returned by the Claude API
+
+        Returns:
+            Dictionary with summary sections and metadata
+        """
+        # Fix: Validate response structure
+        if not message or not hasattr(message, 'content'):
+            logger.error(f"[{company}] Invalid response from Claude API")
+            return self._error_response(company, view, "Invalid API response")
+
+        if not message.content or len(message.content) == 0:
+            logger.error(f"[{company}] Empty content in Claude response")
+            return self._error_response(company, view, "Empty response content")
+
+        # Extract the summary text
+        summary_text = message.content[0].text
+
+        # Format links
+        links = self._format_links(view)
+
+        # input_tokens excludes the cached prefix, so add it back in
+        cache_read = getattr(message.usage, 'cache_read_input_tokens', None) or 0
+        cache_creation = getattr(message.usage, 'cache_creation_input_tokens', None) or 0
+        tokens_used = (
+            message.usage.input_tokens + cache_read + cache_creation
+            + message.usage.output_tokens
+        )
+        logger.info(
+            f"[{company}] Summarization complete. Tokens used: {tokens_used} "
+            f"(cache read: {cache_read}, cache write: {cache_creation})"
+        )
+
+        return {
+            'company': company,
+            'summary': summary_text,
+            'article_count': len(view),
+            'links': links,
+            'tokens_used': tokens_used
+        }
+
+    def _build_prompt(self, company: str, view: ArticlesView) -> List[Dict]:
+        """Build the prompt content blocks for Claude.
 
-        return prompt
+        The static instructions come first and are marked as cacheable so the
+        prefix is shared across every company in a run; only the trailing
+        articles block varies per call.
+
+        Args:
+            company: Company name
+            view: Articles to summarize
+
+        Returns:
+            List of message content blocks
+        """
+        articles_text = self._build_articles_text(view)
+
+        return [
+            {
+                "type": "text",
+                "text": PROMPT_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": _ARTICLES_TEMPLATE.format(company=company, articles_text=articles_text)
+            }
+        ]
+
+    def _build_articles_text(self, view: ArticlesView) -> str:
+        """Render the numbered article list for a prompt.
+
+        Args:
+            view: Articles to render
+
+        Returns:
+            Article list text
+        """
+        # Build article list as a flat buffer of fragments joined once
+        parts = []
+        for idx in range(len(view)):
+            if idx:
+                parts.append("\n")  # Blank line between articles
+
+            parts.extend((
+                str(idx + 1), ". **", view.titles[idx],
+                "**\n   Source: ", view.sources[idx],
+                " | ", self._format_date(view.pubdates[idx]),
+                "\n   URL: ", view.links[idx], "\n"
+            ))
+
+            # Add description if available
+            description = view.descriptions[idx]
+            if description:
+                # Truncate long descriptions
+                if len(description) > MAX_DESCRIPTION_LENGTH:
+                    description = description[:_MAX_DESC_TRUNC] + '...'
+                parts.extend(("   Summary: ", description, "\n"))
+
+        return "".join(parts)
 
     def _format_date(self, pub_date: str) -> str:
         """Format a publication date string.
@@ -188,36 +772,26 @@ class ClaudeClient:
         if not pub_date:
             return 'Date unknown'
 
-        try:
-            dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-            return dt.strftime('%b %d, %Y')
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse date '{pub_date}': {e}")
-            return pub_date[:10] if len(pub_date) >= 10 else pub_date
+        return _format_date_cached(pub_date)
 
-    def _format_links(self, articles: List[Dict]) -> List[Dict]:
+    def _format_links(self, view: ArticlesView) -> List[Dict]:
         """Format articles as link references.
 
         Args:
-            articles: List of article dictionaries
+            view: Articles to format
 
         Returns:
             List of formatted link dictionaries
         """
-        links = []
-        for article in articles:
-            title = article.get('title', 'No title')
-            source = article.get('source_name', 'Unknown source')
-            url = article.get('link', '')
-
-            if url:
-                links.append({
-                    'title': title,
-                    'source': source,
-                    'url': url
-                })
-
-        return links
+        return [
+            {
+                'title': title,
+                'source': source,
+                'url': url
+            }
+            for title, source, url in zip(view.titles, view.sources, view.links)
+            if url
+        ]
 
     def _generate_empty_summary(self) -> str:
         """Generate a summary for when there are no articles.
@@ -230,14 +804,14 @@ class ClaudeClient:
     def _error_response(
         self,
         company: str,
-        articles: List[Dict],
+        view: ArticlesView,
         error: str
     ) -> Dict:
         """Generate an error response.
 
         Args:
             company: Company name
-            articles: List of articles
+            view: Articles that were being summarized
             error: Error message
 
         Returns:
@@ -246,8 +820,8 @@ class ClaudeClient:
         return {
             'company': company,
             'summary': f"**Error generating summary**\n\n{error}",
-            'article_count': len(articles),
-            'links': self._format_links(articles),
+            'article_count': len(view),
+            'links': self._format_links(view),
             'tokens_used': 0,
             'error': error
         }
@@ -1,34 +1,240 @@
 """Newsdata.io API client with advanced query strategies."""
+import re
+import ssl
 import time
-import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
-import pytz
+import functools
+import threading
+import orjson
+import urllib3
+from urllib3.exceptions import HTTPError, MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone as dt_timezone
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+from urllib.parse import urlparse, urlsplit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src.constants import (
     DEFAULT_NEWS_API_TIMEOUT,
     DEFAULT_NEWS_API_MAX_RETRIES,
     DEFAULT_NEWS_MAX_PAGES,
-    PRESS_WIRE_DOMAINS,
-    BLOCKED_NEWS_SOURCES,
+    NEWS_API_PAGE_SIZE,
+    NEWS_API_POOL_MAXSIZE,
+    NEWS_API_MAX_WORKERS,
+    NEWS_QUERY_BATCH_SIZE,
+    NEWS_API_MAX_QUERY_LENGTH,
+    NEWS_API_RATE_PER_SEC,
+    NEWS_API_BURST,
+    NEWS_API_RETRY_BUDGET,
+    NEWS_API_RETRY_REFILL,
+    NEWS_API_RETRY_SUCCESS_CREDIT,
+    NEWS_API_CACHE_SIZE,
+    NEWS_API_CACHE_TTL,
+    PRESS_WIRE_DOMAINS_CSV,
+    BLOCKED_NEWS_SOURCES_CSV,
 )
 from src.utils.logging_config import get_logger
+from src.utils.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
+_WWW_PREFIX = re.compile(r'^www\.')
+
+# Built once per process and shared by every connection in the pool
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL for cross-strategy deduplication.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Lowercased URL without query string, fragment, or trailing slash
+    """
+    if not url:
+        return ''
+    return urlsplit(url)._replace(query='', fragment='').geturl().rstrip('/').lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_domain(url: str) -> str:
+    """Extract a bare lowercase host from a URL or domain.
+
+    Args:
+        url: URL with or without a scheme (e.g. 'https://www.acme.com/news')
+
+    Returns:
+        Host without a leading 'www.' (e.g. 'acme.com')
+    """
+    parsed = urlparse(url if '://' in url else f'https://{url}')
+    return _WWW_PREFIX.sub('', parsed.netloc.lower())
+
+
+@functools.lru_cache(maxsize=256)
+def _kw_or(keywords: Tuple[str, ...]) -> str:
+    """Join an account's keywords into an OR clause, cached across runs."""
+    return ' OR '.join(keywords)
+
+
+@functools.lru_cache(maxsize=16)
+def _tz(name: str):
+    """Resolve a timezone name once per process, falling back to UTC."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        # ValueError covers malformed keys such as '' or absolute paths
+        logger.warning("Unknown timezone: %s. Using UTC", name)
+        return dt_timezone.utc
+
+
+@functools.lru_cache(maxsize=32)
+def _window(days_lookback: int, tz_name: str, today_utc: str) -> Tuple[str, str]:
+    """Compute the query date window, memoized per UTC day.
+
+    Args:
+        days_lookback: Number of days to look back
+        tz_name: Timezone for calculations
+        today_utc: Current UTC date; only used as part of the cache key
+
+    Returns:
+        Tuple of (from_date, to_date) in ISO format
+    """
+    now = datetime.now(_tz(tz_name))
+    from_datetime = now - timedelta(days=days_lookback)
+
+    # Convert to UTC for API
+    from_date_utc = from_datetime.astimezone(dt_timezone.utc)
+    to_date_utc = now.astimezone(dt_timezone.utc)
+
+    # Format as ISO date strings
+    from_date = from_date_utc.strftime('%Y-%m-%d')
+    to_date = to_date_utc.strftime('%Y-%m-%d')
+
+    return from_date, to_date
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache of raw API pages with a per-entry TTL.
+
+    Pages are stored as the undecoded response body so every hit hands
+    out fresh article dictionaries that callers are free to mutate.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        """Store a response body, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Module scope so warm Lambda invocations reuse pages fetched earlier
+_RESPONSE_CACHE = _ResponseCache(NEWS_API_CACHE_SIZE, NEWS_API_CACHE_TTL)
+
+
+class _UrlDeduper:
+    """Thread-safe set of canonical URLs shared by one account's strategies.
+
+    With a budget, the deduper also signals the strategies to stop
+    paginating once the account has that many unique articles in total.
+    """
+
+    def __init__(self, budget: Optional[int] = None):
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._budget = budget
+        self._stop = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the account's article budget has been met."""
+        return self._stop.is_set()
+
+    def claim(self, articles: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+        """Record articles and return only those not seen before.
+
+        Args:
+            articles: Article dictionaries from one API page
+            limit: Maximum number of articles to claim; the rest of the page
+                is left unclaimed for the other strategies
+
+        Returns:
+            Articles whose canonical URL was not already claimed
+        """
+        new = []
+        with self._lock:
+            for article in articles:
+                if limit is not None and len(new) >= limit:
+                    break
+                url = _canonical_url(article.get('link', ''))
+                if url and url not in self._seen:
+                    self._seen.add(url)
+                    new.append(article)
+            if self._budget is not None and len(self._seen) >= self._budget:
+                self._stop.set()
+        return new
+
+
+class _BudgetedRetry(Retry):
+    """Retry policy that also spends from a client-wide retry budget.
+
+    Each retry takes a token from the shared bucket; once it is empty the
+    request fails immediately instead of backing off against an API that
+    is already struggling. Successful requests earn tokens back.
+    """
+
+    def __init__(self, *args, budget: Optional[TokenBucket] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.budget = self.budget
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.budget is not None and not self.budget.try_consume():
+            raise MaxRetryError(_pool, url, error or ResponseError("retry budget exhausted"))
+        return retry
+
 
 class NewsdataClient:
     """Client for interacting with Newsdata.io API."""
 
-    BASE_URL = "https://newsdata.io/api/1/news"
+    API_HOST = "newsdata.io"
+    API_PATH = "/api/1/news"
 
     def __init__(
         self,
         api_key: str,
         timeout: int = DEFAULT_NEWS_API_TIMEOUT,
-        max_retries: int = DEFAULT_NEWS_API_MAX_RETRIES
+        max_retries: int = DEFAULT_NEWS_API_MAX_RETRIES,
+        rate_per_sec: float = NEWS_API_RATE_PER_SEC,
+        burst: int = NEWS_API_BURST,
+        max_workers: int = NEWS_API_MAX_WORKERS
     ):
         """Initialize the Newsdata client.
 
@@ -36,6 +242,9 @@ class NewsdataClient:
             api_key: Newsdata.io API key
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            rate_per_sec: Sustained request rate across all threads
+            burst: Requests allowed back-to-back before throttling
+            max_workers: Strategy fetches in flight at once across all accounts
         """
         if not api_key:
             raise ValueError("API key cannot be empty")
@@ -43,7 +252,71 @@ class NewsdataClient:
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.max_workers = max_workers
+
+        # All strategies share one bucket so concurrent fan-out stays under
+        # the API rate limit instead of relying on 429 retries
+        self._bucket = TokenBucket(burst, rate_per_sec)
+
+        # Retries happen at the transport layer: rate limits and server errors
+        # back off exponentially (or per Retry-After) on the same connection,
+        # drawing on a shared budget so an outage fails fast across threads
+        self._retry_budget = TokenBucket(NEWS_API_RETRY_BUDGET, NEWS_API_RETRY_REFILL)
+        retry = _BudgetedRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET']),
+            budget=self._retry_budget
+        )
+
+        # Every request goes to one host, so talk to a single urllib3 pool
+        # directly. It is sized for the concurrent strategies and blocks
+        # rather than opening throwaway connections when all are busy
+        self._pool = urllib3.HTTPSConnectionPool(
+            self.API_HOST,
+            maxsize=max(NEWS_API_POOL_MAXSIZE, max_workers),
+            block=True,
+            retries=retry,
+            timeout=timeout,
+            ssl_context=_SSL_CONTEXT
+        )
+
+        # Resolve DNS and finish the TLS handshake while the caller is still
+        # setting up, so the first real request finds a warm connection
+        threading.Thread(target=self._prewarm, name='newsdata-prewarm', daemon=True).start()
+
+        # One worker pool for the client's lifetime, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _prewarm(self) -> None:
+        """Open one pooled connection to the API host, ignoring any failure."""
+        try:
+            self._pool.request('HEAD', '/', retries=False)
+        except Exception as e:
+            logger.debug("Connection pre-warm failed: %s", e)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared strategy executor, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='newsdata'
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool and release pooled connections."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self._pool.close()
 
     def fetch_articles_for_account(
         self,
@@ -53,7 +326,8 @@ class NewsdataClient:
         newsroom: Optional[str],
         days_lookback: int,
         max_articles: int,
-        timezone: str = 'America/New_York'
+        timezone: str = 'America/New_York',
+        date_window: Optional[Tuple[str, str]] = None
     ) -> List[Dict]:
         """Fetch articles for a specific account using three query strategies.
 
@@ -65,63 +339,236 @@ class NewsdataClient:
             days_lookback: Number of days to look back
             max_articles: Maximum articles to fetch per account
             timezone: Timezone for date calculations
+            date_window: Precomputed (from_date, to_date); computed if omitted
 
         Returns:
             List of article dictionaries
         """
-        from_date, to_date = self._get_date_window(days_lookback, timezone)
+        from_date, to_date = date_window or self.get_date_window(days_lookback, timezone)
 
         # Fix: Ensure at least 1 article per strategy
         articles_per_strategy = max(1, max_articles // 3)
-        logger.info(f"[{company}] Fetching {articles_per_strategy} articles per strategy")
+        logger.debug("[%s] Fetching %d articles per strategy", company, articles_per_strategy)
 
-        # Parallel execution of all three strategies
+        # Parallel execution of all three strategies; the same press release
+        # often surfaces in all of them, so they share one URL set
         all_articles = []
+        deduper = _UrlDeduper(budget=max_articles)
+        executor = self._get_executor()
+        futures = {}
+
+        # Strategy 1: Direct mentions in headlines
+        future1 = executor.submit(
+            self._fetch_direct_mentions,
+            company, from_date, to_date, articles_per_strategy, deduper
+        )
+        futures[future1] = "direct_mentions"
+
+        # Strategy 2: Official press (company domain and newsroom)
+        if website or newsroom:
+            future2 = executor.submit(
+                self._fetch_official_press,
+                company, website, newsroom, from_date, to_date, articles_per_strategy, deduper
+            )
+            futures[future2] = "official_press"
+
+        # Strategy 3: Press wires and partner activity
+        future3 = executor.submit(
+            self._fetch_press_wires,
+            company, keywords, from_date, to_date, articles_per_strategy, deduper
+        )
+        futures[future3] = "press_wires"
+
+        # Collect results
+        for future in as_completed(futures):
+            strategy = futures[future]
+            try:
+                articles = future.result()
+                all_articles.extend(articles)
+                logger.debug("[%s] %s: %d articles", company, strategy, len(articles))
+            except Exception as e:
+                logger.error("[%s] Error in %s: %s", company, strategy, e)
+
+        logger.info("[%s] Total fetched: %d articles", company, len(all_articles))
+        return all_articles
+
+    def fetch_articles_for_accounts(
+        self,
+        accounts: List,
+        days_lookback: int,
+        max_articles: int,
+        timezone: str = 'America/New_York',
+        date_window: Optional[Tuple[str, str]] = None
+    ) -> Dict[str, List[Dict]]:
+        """Fetch articles for several accounts at once.
+
+        Direct-mention searches are batched: up to NEWS_QUERY_BATCH_SIZE
+        companies are OR'd into one query and the results are assigned back
+        to the companies named in each article. The official-press and
+        press-wire strategies stay per account since they depend on each
+        account's domains and keywords. Every strategy for every account is
+        submitted at once; the client's max_workers bounds how many are in
+        flight, and the shared rate and retry buckets bound the request rate.
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {}
+        Args:
+            accounts: List of AccountConfig objects
+            days_lookback: Number of days to look back
+            max_articles: Maximum articles to fetch per account
+            timezone: Timezone for date calculations
+            date_window: Precomputed (from_date, to_date); computed if omitted
+
+        Returns:
+            Dictionary mapping company name to its list of articles
+        """
+        from_date, to_date = date_window or self.get_date_window(days_lookback, timezone)
+        articles_per_strategy = max(1, max_articles // 3)
+
+        results: Dict[str, List[Dict]] = {account.company: [] for account in accounts}
+        dedupers = {company: _UrlDeduper(budget=max_articles) for company in results}
 
-            # Strategy 1: Direct mentions in headlines
-            future1 = executor.submit(
-                self._fetch_direct_mentions,
-                company, from_date, to_date, articles_per_strategy
+        executor = self._get_executor()
+        futures = {}
+
+        # Strategy 1: Direct mentions, batched across companies
+        for chunk in self._chunk_companies(list(results)):
+            future = executor.submit(
+                self._fetch_direct_mentions_batch,
+                chunk, from_date, to_date, articles_per_strategy, dedupers
             )
-            futures[future1] = "direct_mentions"
+            futures[future] = (chunk, "direct_mentions")
 
+        for account in accounts:
             # Strategy 2: Official press (company domain and newsroom)
-            if website or newsroom:
-                future2 = executor.submit(
+            if account.website or account.newsroom:
+                future = executor.submit(
                     self._fetch_official_press,
-                    company, website, newsroom, from_date, to_date, articles_per_strategy
+                    account.company, account.website, account.newsroom,
+                    from_date, to_date, articles_per_strategy, dedupers[account.company]
                 )
-                futures[future2] = "official_press"
+                futures[future] = ([account.company], "official_press")
 
             # Strategy 3: Press wires and partner activity
-            future3 = executor.submit(
+            future = executor.submit(
                 self._fetch_press_wires,
-                company, keywords, from_date, to_date, articles_per_strategy
+                account.company, account.keywords, from_date, to_date, articles_per_strategy,
+                dedupers[account.company]
             )
-            futures[future3] = "press_wires"
-
-            # Collect results
-            for future in as_completed(futures):
-                strategy = futures[future]
-                try:
-                    articles = future.result()
-                    all_articles.extend(articles)
-                    logger.info(f"[{company}] {strategy}: {len(articles)} articles")
-                except Exception as e:
-                    logger.error(f"[{company}] Error in {strategy}: {e}")
-
-        logger.info(f"[{company}] Total fetched: {len(all_articles)} articles")
-        return all_articles
+            futures[future] = ([account.company], "press_wires")
+
+        # Collect results
+        for future in as_completed(futures):
+            companies, strategy = futures[future]
+            try:
+                fetched = future.result()
+            except Exception as e:
+                logger.error("[%s] Error in %s: %s", ', '.join(companies), strategy, e)
+                continue
+
+            if strategy == "direct_mentions":
+                for company, articles in fetched.items():
+                    results[company].extend(articles)
+                    logger.debug("[%s] %s: %d articles", company, strategy, len(articles))
+            else:
+                results[companies[0]].extend(fetched)
+                logger.debug("[%s] %s: %d articles", companies[0], strategy, len(fetched))
+
+        for company, articles in results.items():
+            logger.info("[%s] Total fetched: %d articles", company, len(articles))
+
+        return results
+
+    def _chunk_companies(self, companies: List[str]) -> List[List[str]]:
+        """Group companies into batches that fit in a single query.
+
+        Args:
+            companies: Company names
+
+        Returns:
+            List of company name batches
+        """
+        chunks = []
+        current: List[str] = []
+        for company in companies:
+            candidate = current + [company]
+            if current and (
+                len(candidate) > NEWS_QUERY_BATCH_SIZE
+                or len(self._or_query(candidate)) > NEWS_API_MAX_QUERY_LENGTH
+            ):
+                chunks.append(current)
+                candidate = [company]
+            current = candidate
+
+        if current:
+            chunks.append(current)
+
+        return chunks
+
+    def _or_query(self, companies: List[str]) -> str:
+        """Build a query matching any of the given company names."""
+        return ' OR '.join(f'"{company}"' for company in companies)
+
+    def _fetch_direct_mentions_batch(
+        self,
+        companies: List[str],
+        from_date: str,
+        to_date: str,
+        max_results: int,
+        dedupers: Dict[str, _UrlDeduper]
+    ) -> Dict[str, List[Dict]]:
+        """Fetch direct mentions for a batch of companies with one query.
+
+        Args:
+            companies: Company names in this batch
+            from_date: Start date
+            to_date: End date
+            max_results: Maximum articles per company
+            dedupers: Per-company URL sets shared with the other strategies
+
+        Returns:
+            Dictionary mapping company name to its new articles
+        """
+        if len(companies) == 1:
+            company = companies[0]
+            return {company: self._fetch_direct_mentions(
+                company, from_date, to_date, max_results, dedupers[company]
+            )}
+
+        params = {
+            'q': self._or_query(companies),
+            'language': 'en',
+            'from_date': from_date,
+            'to_date': to_date,
+            'prioritydomain': 'top'
+        }
+        articles = self._paginated_fetch(params, max_results * len(companies))
+
+        # Assign each article to the companies it names; longest names first so
+        # "Meta Platforms" wins over "Meta". Each name gets its own group, since
+        # IGNORECASE also folds Unicode ('ſ' matches 's'), so matched text
+        # can't be mapped back to a company by lowercasing it
+        names = sorted(companies, key=len, reverse=True)
+        pattern = re.compile(
+            '|'.join(f'(?P<c{i}>{re.escape(name)})' for i, name in enumerate(names)),
+            re.IGNORECASE
+        )
+        by_group = {f'c{i}': name for i, name in enumerate(names)}
+
+        matched: Dict[str, List[Dict]] = {company: [] for company in companies}
+        for article in articles:
+            text = f"{article.get('title') or ''} {article.get('description') or ''}"
+            for company in {by_group[m.lastgroup] for m in pattern.finditer(text)}:
+                if len(matched[company]) < max_results:
+                    matched[company].extend(dedupers[company].claim([article]))
+
+        return matched
 
     def _fetch_direct_mentions(
         self,
         company: str,
         from_date: str,
         to_date: str,
-        max_results: int
+        max_results: int,
+        deduper: Optional[_UrlDeduper] = None
     ) -> List[Dict]:
         """Fetch articles with direct company mentions in title."""
         params = {
@@ -131,7 +578,7 @@ class NewsdataClient:
             'to_date': to_date,
             'prioritydomain': 'top'
         }
-        return self._paginated_fetch(params, max_results)
+        return self._paginated_fetch(params, max_results, deduper)
 
     def _fetch_official_press(
         self,
@@ -140,25 +587,22 @@ class NewsdataClient:
         newsroom: Optional[str],
         from_date: str,
         to_date: str,
-        max_results: int
+        max_results: int,
+        deduper: Optional[_UrlDeduper] = None
     ) -> List[Dict]:
         """Fetch articles from company's official domains."""
         domains = [website] if website else []
 
         if newsroom:
-            # Fix: Properly extract domain using urlparse
             try:
-                parsed = urlparse(newsroom)
-                newsroom_domain = parsed.netloc or newsroom.split('/')[0]
-                # Remove www prefix
-                newsroom_domain = newsroom_domain.replace('www.', '')
-                if newsroom_domain and newsroom_domain != website:
+                newsroom_domain = _normalize_domain(newsroom)
+                if newsroom_domain and newsroom_domain != _normalize_domain(website or ''):
                     domains.append(newsroom_domain)
             except Exception as e:
-                logger.warning(f"[{company}] Failed to parse newsroom URL {newsroom}: {e}")
+                logger.warning("[%s] Failed to parse newsroom URL %s: %s", company, newsroom, e)
 
         if not domains:
-            logger.warning(f"[{company}] No domains for official press search")
+            logger.warning("[%s] No domains for official press search", company)
             return []
 
         params = {
@@ -167,7 +611,7 @@ class NewsdataClient:
             'from_date': from_date,
             'to_date': to_date
         }
-        return self._paginated_fetch(params, max_results)
+        return self._paginated_fetch(params, max_results, deduper)
 
     def _fetch_press_wires(
         self,
@@ -175,11 +619,12 @@ class NewsdataClient:
         keywords: List[str],
         from_date: str,
         to_date: str,
-        max_results: int
+        max_results: int,
+        deduper: Optional[_UrlDeduper] = None
     ) -> List[Dict]:
         """Fetch articles from press wires with keyword matching."""
         # Build query with keywords and company name
-        keyword_terms = ' OR '.join(keywords[:6])  # Limit to avoid overly long queries
+        keyword_terms = _kw_or(tuple(keywords[:6]))  # Limit to avoid overly long queries
         query = f'({keyword_terms}) AND "{company}"'
 
         params = {
@@ -187,22 +632,36 @@ class NewsdataClient:
             'language': 'en',
             'from_date': from_date,
             'to_date': to_date,
-            'domainurl': ','.join(PRESS_WIRE_DOMAINS),
-            'excludedomain': ','.join(BLOCKED_NEWS_SOURCES)
+            'domainurl': PRESS_WIRE_DOMAINS_CSV,
+            'excludedomain': BLOCKED_NEWS_SOURCES_CSV
         }
-        return self._paginated_fetch(params, max_results)
+        return self._paginated_fetch(params, max_results, deduper)
 
     def _paginated_fetch(
         self,
         params: Dict,
-        max_results: int
+        max_results: int,
+        deduper: Optional[_UrlDeduper] = None
     ) -> List[Dict]:
-        """Fetch articles with pagination support."""
+        """Fetch articles with pagination support.
+
+        When a deduper is given only articles not already claimed by another
+        strategy are kept and counted, so pagination stops once enough new
+        articles have been found, or once the strategies together have met
+        the account's budget.
+        """
         articles = []
         next_page = None
         page_count = 0
 
+        # Ask only for as many results per page as we can use, so small
+        # quotas don't pay to transfer and decode a full page
+        params.setdefault('size', max(1, min(max_results, NEWS_API_PAGE_SIZE)))
+
         while len(articles) < max_results and page_count < DEFAULT_NEWS_MAX_PAGES:
+            if deduper is not None and deduper.stopped:
+                break
+
             try:
                 # Add pagination token if available
                 if next_page:
@@ -216,7 +675,7 @@ class NewsdataClient:
 
                 # Fix: Validate response structure
                 if not isinstance(response, dict):
-                    logger.error(f"Invalid response type: {type(response)}")
+                    logger.error("Invalid response type: %s", type(response))
                     break
 
                 if response.get('status') == 'success':
@@ -225,77 +684,82 @@ class NewsdataClient:
                         logger.error("Results is not a list")
                         break
 
+                    # Only claim what will be kept, so URLs past the quota
+                    # stay available to the account's other strategies
+                    if deduper is not None:
+                        results = deduper.claim(results, max_results - len(articles))
                     articles.extend(results)
 
-                    # Check for next page
+                    # Stop as soon as we have enough; otherwise follow the cursor
                     next_page = response.get('nextPage')
-                    if not next_page:
+                    if len(articles) >= max_results or not next_page:
                         break
 
                     page_count += 1
-                    # Only sleep when actually paginating
                 elif response.get('status') == 'error':
                     error_msg = response.get('results', {}).get('message', 'Unknown error')
-                    logger.error(f"API error: {error_msg}")
+                    logger.error("API error: %s", error_msg)
                     break
                 else:
-                    logger.warning(f"Unexpected response status: {response.get('status')}")
+                    logger.warning("Unexpected response status: %s", response.get('status'))
                     break
 
             except Exception as e:
-                logger.error(f"Error during pagination: {e}")
+                logger.error("Error during pagination: %s", e)
                 break
 
-        return articles[:max_results]
+        if len(articles) > max_results:
+            del articles[max_results:]
+        return articles
 
     def _make_request(self, params: Dict) -> Optional[Dict]:
-        """Make an API request with retry logic."""
+        """Make a rate-limited API request (retries are handled by the connection pool).
+
+        Successful pages are cached by their query parameters, so repeated
+        queries within NEWS_API_CACHE_TTL cost neither quota nor a round-trip.
+        """
+        cache_key = tuple(sorted(params.items()))
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+
         # Add API key to params
         request_params = params.copy()
         request_params['apikey'] = self.api_key
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=request_params,
-                    timeout=self.timeout
-                )
+        self._bucket.acquire()
 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Rate limited. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-
-                # Handle server errors
-                if response.status_code >= 500:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Server error {response.status_code}. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-
-                response.raise_for_status()
-                return response.json()
-
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{self.max_retries})")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-            except ValueError as e:
-                # JSON decode error
-                logger.error(f"Failed to parse response JSON: {e}")
-                break
+        try:
+            response = self._pool.request('GET', self.API_PATH, fields=request_params)
+            if 400 <= response.status < 500:
+                # Only 429 is retried (by the pool); other client errors such
+                # as a bad key or query will never succeed, so fail fast
+                logger.error(
+                    "Client error %s: %s",
+                    response.status, response.data[:200].decode('utf-8', 'replace')
+                )
+                return None
+            if response.status >= 500:
+                logger.error("Request error: HTTP %s", response.status)
+                return None
+
+            self._retry_budget.credit(NEWS_API_RETRY_SUCCESS_CREDIT)
+            data = orjson.loads(response.data)
+            if isinstance(data, dict) and data.get('status') == 'success':
+                _RESPONSE_CACHE.set(cache_key, response.data)
+            return data
+
+        except ValueError as e:
+            # JSON decode error
+            logger.error("Failed to parse response JSON: %s", e)
+        except MaxRetryError as e:
+            logger.error("All retry attempts exhausted: %s", e)
+        except HTTPError as e:
+            logger.error("Request error: %s", e)
 
-        logger.error("All retry attempts exhausted")
         return None
 
-    def _get_date_window(
+    def get_date_window(
         self,
         days_lookback: int,
         timezone: str
@@ -309,21 +773,7 @@ class NewsdataClient:
         Returns:
             Tuple of (from_date, to_date) in ISO format
         """
-        try:
-            tz = pytz.timezone(timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
-            logger.warning(f"Unknown timezone: {timezone}. Using UTC")
-            tz = pytz.UTC
-
-        now = datetime.now(tz)
-        from_datetime = now - timedelta(days=days_lookback)
-
-        # Convert to UTC for API
-        from_date_utc = from_datetime.astimezone(pytz.UTC)
-        to_date_utc = now.astimezone(pytz.UTC)
-
-        # Format as ISO date strings
-        from_date = from_date_utc.strftime('%Y-%m-%d')
-        to_date = to_date_utc.strftime('%Y-%m-%d')
-
-        return from_date, to_date
+        # The window only changes when the UTC date does, so it is computed
+        # once per day instead of once per account
+        today_utc = datetime.now(dt_timezone.utc).date().isoformat()
+        return _window(days_lookback, timezone, today_utc)
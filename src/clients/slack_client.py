@@ -1,8 +1,20 @@
 """Slack client for posting weekly news briefs."""
-import json
+import time
+import random
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 
+from src.constants import (
+    SLACK_POST_RATE_PER_SEC,
+    SLACK_POST_BURST,
+    SLACK_MAX_RETRIES,
+    SLACK_REQUEST_TIMEOUT,
+)
+from src.utils.rate_limit import TokenBucket
+
 
 class SlackClient:
     """Client for posting messages to Slack."""
@@ -16,6 +28,28 @@ class SlackClient:
         self.bot_token = bot_token
         self.base_url = "https://slack.com/api"
 
+        # Reuse one keep-alive connection to slack.com for every post
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {bot_token}",
+            "Content-Type": "application/json"
+        })
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+
+        # Keep posts under Slack's per-channel rate
+        self._bucket = TokenBucket(SLACK_POST_BURST, SLACK_POST_RATE_PER_SEC)
+
+        # Warm the connection to slack.com in the background while the brief
+        # is being built
+        threading.Thread(target=self._prewarm, name='slack-prewarm', daemon=True).start()
+
+    def _prewarm(self) -> None:
+        """Open one pooled connection to Slack, ignoring any failure."""
+        try:
+            self.session.head(f"{self.base_url}/api.test", timeout=SLACK_REQUEST_TIMEOUT)
+        except Exception:
+            pass
+
     def post_weekly_brief(
         self,
         channel_id: str,
@@ -36,12 +70,13 @@ class SlackClient:
             print("No summaries to post")
             return {'success': False, 'error': 'No summaries provided'}
 
-        # Build the main message
-        message_blocks = self._build_message_blocks(summaries)
+        # Build each account's blocks once; the single message and the
+        # threaded replies are both assembled from these
+        per_account = [self._build_account_blocks(summary) for summary in summaries]
+        message_blocks = self._build_message_blocks(per_account)
 
         # Check message size
-        message_json = json.dumps(message_blocks)
-        message_size = len(message_json)
+        message_size = self._estimate_message_size(per_account)
         print(f"Message size: {message_size} bytes")
 
         if dry_run:
@@ -61,7 +96,7 @@ class SlackClient:
         try:
             # Check if message needs threading due to size
             if message_size > 30000:  # Slack's limit is ~40KB, be safe
-                return self._post_threaded(channel_id, summaries)
+                return self._post_threaded(channel_id, per_account)
             else:
                 return self._post_single(channel_id, message_blocks)
 
@@ -69,11 +104,11 @@ class SlackClient:
             print(f"Error posting to Slack: {e}")
             return {'success': False, 'error': str(e)}
 
-    def _build_message_blocks(self, summaries: List[Dict]) -> List[Dict]:
+    def _build_message_blocks(self, per_account: List[List[Dict]]) -> List[Dict]:
         """Build Slack message blocks for the brief.
 
         Args:
-            summaries: List of account summaries
+            per_account: Blocks for each account, from _build_account_blocks
 
         Returns:
             List of Slack block dictionaries
@@ -94,7 +129,7 @@ class SlackClient:
             "elements": [
                 {
                     "type": "mrkdwn",
-                    "text": f"Updates from {len(summaries)} accounts"
+                    "text": f"Updates from {len(per_account)} accounts"
                 }
             ]
         })
@@ -102,45 +137,79 @@ class SlackClient:
         blocks.append({"type": "divider"})
 
         # Each account
-        for idx, summary in enumerate(summaries):
-            company = summary.get('company', 'Unknown Company')
-            summary_text = summary.get('summary', '')
-            links = summary.get('links', [])
-            article_count = summary.get('article_count', 0)
+        for idx, account_blocks in enumerate(per_account):
+            blocks.extend(account_blocks)
+
+            # Divider between accounts (except after last)
+            if idx < len(per_account) - 1:
+                blocks.append({"type": "divider"})
+
+        return blocks
+
+    def _estimate_message_size(self, per_account: List[List[Dict]]) -> int:
+        """Estimate the serialized size of the full message.
+
+        Each account is serialized on its own and the sizes are summed with
+        the fixed header and divider overhead, so the assembled message
+        never has to be dumped to a string just to be measured.
+
+        Args:
+            per_account: Blocks for each account, from _build_account_blocks
+
+        Returns:
+            Approximate message size in bytes
+        """
+        frame = len(orjson.dumps(self._build_message_blocks([])))
+        dividers = max(0, len(per_account) - 1) * len('{"type":"divider"},')
+        accounts = sum(
+            len(orjson.dumps(blocks)) + 1 for blocks in per_account
+        )
+        return frame + dividers + accounts
+
+    def _build_account_blocks(self, summary: Dict) -> List[Dict]:
+        """Build the Slack blocks for one account's summary.
+
+        Args:
+            summary: Account summary
+
+        Returns:
+            List of Slack block dictionaries
+        """
+        blocks = []
+        company = summary.get('company', 'Unknown Company')
+        summary_text = summary.get('summary', '')
+        links = summary.get('links', [])
+        article_count = summary.get('article_count', 0)
 
-            # Company header
+        # Company header
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*{company}*\n_{article_count} articles this week_"
+            }
+        })
+
+        # Summary content
+        if summary_text:
             blocks.append({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*{company}*\n_{article_count} articles this week_"
+                    "text": summary_text
                 }
             })
 
-            # Summary content
-            if summary_text:
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": summary_text
-                    }
-                })
-
-            # Links section
-            if links:
-                links_text = self._format_links_for_slack(links)
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Links:*\n{links_text}"
-                    }
-                })
-
-            # Divider between accounts (except after last)
-            if idx < len(summaries) - 1:
-                blocks.append({"type": "divider"})
+        # Links section
+        if links:
+            links_text = self._format_links_for_slack(links)
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*Links:*\n{links_text}"
+                }
+            })
 
         return blocks
 
@@ -175,17 +244,12 @@ class SlackClient:
             Response dictionary
         """
         url = f"{self.base_url}/chat.postMessage"
-        headers = {
-            "Authorization": f"Bearer {self.bot_token}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "channel": channel_id,
             "blocks": blocks
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        result = response.json()
+        result = self._post_with_retry(url, payload)
 
         if result.get('ok'):
             print(f"Successfully posted to Slack (message ts: {result.get('ts')})")
@@ -202,19 +266,18 @@ class SlackClient:
                 'error': error
             }
 
-    def _post_threaded(self, channel_id: str, summaries: List[Dict]) -> Dict:
+    def _post_threaded(self, channel_id: str, per_account: List[List[Dict]]) -> Dict:
         """Post as threaded messages when content is too large.
 
         Args:
             channel_id: Slack channel ID
-            summaries: List of account summaries
+            per_account: Blocks for each account, from _build_account_blocks
 
         Returns:
             Response dictionary
         """
         # Post first account as main message
-        first_summary = [summaries[0]]
-        first_blocks = self._build_message_blocks(first_summary)
+        first_blocks = self._build_message_blocks(per_account[:1])
 
         main_result = self._post_single(channel_id, first_blocks)
         if not main_result.get('success'):
@@ -222,17 +285,17 @@ class SlackClient:
 
         thread_ts = main_result.get('ts')
 
-        # Post remaining accounts as thread replies
-        for summary in summaries[1:]:
-            thread_blocks = self._build_message_blocks([summary])
-            self._post_reply(channel_id, thread_ts, thread_blocks)
+        # Post remaining accounts as thread replies, one at a time so they
+        # appear in account order; the bucket paces them under the rate limit
+        for account_blocks in per_account[1:]:
+            self._post_reply(channel_id, thread_ts, self._build_message_blocks([account_blocks]))
 
         return {
             'success': True,
             'threaded': True,
             'ts': thread_ts,
             'channel': channel_id,
-            'account_count': len(summaries)
+            'account_count': len(per_account)
         }
 
     def _post_reply(self, channel_id: str, thread_ts: str, blocks: List[Dict]) -> Dict:
@@ -247,18 +310,40 @@ class SlackClient:
             Response dictionary
         """
         url = f"{self.base_url}/chat.postMessage"
-        headers = {
-            "Authorization": f"Bearer {self.bot_token}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "channel": channel_id,
             "thread_ts": thread_ts,
             "blocks": blocks
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        return response.json()
+        return self._post_with_retry(url, payload)
+
+    def _post_with_retry(self, url: str, payload: Dict) -> Dict:
+        """POST a payload, waiting out rate limits as Slack instructs.
+
+        On a 429 the client sleeps for the Retry-After interval (or an
+        exponential default) plus jitter, so concurrent posters don't all
+        retry at the same instant.
+
+        Args:
+            url: Slack API URL
+            payload: JSON payload
+
+        Returns:
+            Decoded response body
+        """
+        body = orjson.dumps(payload)
+
+        for attempt in range(SLACK_MAX_RETRIES + 1):
+            self._bucket.acquire()
+            response = self.session.post(url, data=body, timeout=SLACK_REQUEST_TIMEOUT)
+            if response.status_code != 429 or attempt == SLACK_MAX_RETRIES:
+                break
+
+            retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+            time.sleep(retry_after + random.uniform(0, 0.5 * retry_after))
+
+        return orjson.loads(response.content)
 
     def _print_preview(self, summaries: List[Dict]) -> None:
         """Print a preview of the message.
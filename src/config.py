@@ -1,16 +1,19 @@
 """Configuration management for the weekly news automation."""
 import os
 import json
-import yaml
-import boto3
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import time
+import random
+import functools
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 
 from src.constants import (
     DEFAULT_DAYS_LOOKBACK,
     DEFAULT_ARTICLES_PER_ACCOUNT,
     DEFAULT_CLAUDE_MODEL,
     DEFAULT_TIMEZONE,
+    DEFAULT_SUMMARY_CACHE_PATH,
     REPUTABLE_NEWS_SOURCES,
     BLOCKED_NEWS_SOURCES,
     ENV_SLACK_CHANNEL_ID,
@@ -22,17 +25,111 @@ from src.constants import (
     ENV_CONFIG_S3_KEY,
     ENV_USE_DYNAMODB,
     ENV_DYNAMODB_TABLE,
+    ENV_DAX_ENDPOINT,
+    ENV_SUMMARY_CACHE_PATH,
+    SECRETS_CACHE_TTL,
+    SECRETS_MAX_ATTEMPTS,
+    SECRETS_BACKOFF_BASE,
+    SECRETS_BACKOFF_MAX,
 )
+from src.utils.aws import get_client
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+# Validated secrets and their expiry (monotonic time), shared by every Config
+# in the process so warm Lambda invocations skip Secrets Manager
+_SECRETS_CACHE: Optional[Tuple[float, Dict[str, str]]] = None
+
+# Parsed account lists keyed by source ('file:<path>' or 's3://bucket/key'),
+# each with the version it was parsed from (file mtime or S3 ETag), so warm
+# invocations only re-parse the config after it changes
+_ACCOUNTS_CACHE: Dict[str, Tuple[str, List['AccountConfig']]] = {}
+
+# Secrets Manager error codes that mean "slow down" rather than "failed"
+_THROTTLING_CODES = frozenset({'ThrottlingException', 'RequestLimitExceeded', 'TooManyRequestsException'})
+
+
 class ConfigError(Exception):
     """Configuration-related errors."""
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    """Import PyYAML on first use and pick the fastest safe loader.
+
+    YAML is only needed when an account file is not precompiled to JSON,
+    so the import is kept off the cold-start path.
+
+    Returns:
+        Tuple of (yaml module, loader class)
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader; PyYAML wheels normally bundle it
+    loader = getattr(yaml, 'CSafeLoader', None)
+    if loader is None:
+        logger.warning("PyYAML was built without libyaml; account files use the slower pure-Python loader")
+        loader = yaml.SafeLoader
+    return yaml, loader
+
+
+def _load_yaml(stream):
+    """Parse a YAML document safely.
+
+    Args:
+        stream: YAML text or file object
+
+    Returns:
+        Parsed document
+
+    Raises:
+        ConfigError: If the document is not valid YAML
+    """
+    yaml, loader = _yaml_loader()
+    try:
+        return yaml.load(stream, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML format: {e}")
+
+
+def _error_code(error: Exception) -> str:
+    """Return the AWS error code of a botocore ClientError."""
+    return error.response.get('Error', {}).get('Code', '')
+
+
+def _call_with_backoff(operation, **kwargs):
+    """Call a Secrets Manager operation, retrying while it is throttled.
+
+    Retries use capped exponential backoff with jitter so concurrent cold
+    starts don't retry in lockstep.
+
+    Args:
+        operation: Bound boto3 client method
+        **kwargs: Request parameters
+
+    Returns:
+        Operation response
+
+    Raises:
+        ClientError: If the call fails for a reason other than throttling,
+            or is still throttled after SECRETS_MAX_ATTEMPTS tries
+    """
+    from botocore.exceptions import ClientError
+
+    for attempt in range(SECRETS_MAX_ATTEMPTS):
+        try:
+            return operation(**kwargs)
+        except ClientError as e:
+            if _error_code(e) not in _THROTTLING_CODES or attempt == SECRETS_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(SECRETS_BACKOFF_MAX, SECRETS_BACKOFF_BASE * 2 ** attempt)
+            logger.warning(f"Secrets Manager throttled; retrying in {delay:.1f}s")
+            time.sleep(delay + random.uniform(0, delay))
+
+
 @dataclass
 class AccountConfig:
     """Configuration for a single account."""
@@ -70,6 +167,11 @@ class AccountConfig:
         )
 
 
+def _copy_accounts(accounts: List[AccountConfig]) -> List[AccountConfig]:
+    """Copy cached accounts so callers can't modify the shared cache entry."""
+    return [replace(account, keywords=list(account.keywords)) for account in accounts]
+
+
 class Config:
     """Main configuration class."""
 
@@ -101,6 +203,10 @@ class Config:
         self.config_s3_key = os.environ.get(ENV_CONFIG_S3_KEY, '')
         self.use_dynamodb = os.environ.get(ENV_USE_DYNAMODB, 'false').lower() == 'true'
         self.dynamodb_table = os.environ.get(ENV_DYNAMODB_TABLE, 'weekly-news-seen-urls')
+        # Optional DAX cluster for seen-URL reads (requires amazon-dax-client)
+        self.dax_endpoint = os.environ.get(ENV_DAX_ENDPOINT, '')
+        # Empty string disables the Claude summary cache
+        self.summary_cache_path = os.environ.get(ENV_SUMMARY_CACHE_PATH, DEFAULT_SUMMARY_CACHE_PATH)
 
         # Secrets (lazy-loaded)
         self._secrets_cache: Optional[Dict[str, str]] = None
@@ -113,24 +219,41 @@ class Config:
     def secrets(self) -> Dict[str, str]:
         """Lazy-load secrets from AWS Secrets Manager.
 
+        Validated secrets are reused across Config instances in the same
+        process for SECRETS_CACHE_TTL seconds, so rotated values are picked
+        up without a redeploy.
+
         Returns:
             Dictionary of secrets
 
         Raises:
             ConfigError: If critical secrets are missing
         """
+        global _SECRETS_CACHE
+
         if self._secrets_cache is None:
-            self._secrets_cache = self._load_secrets()
-            self._validate_secrets(self._secrets_cache)
+            if _SECRETS_CACHE is not None and _SECRETS_CACHE[0] > time.monotonic():
+                self._secrets_cache = _SECRETS_CACHE[1]
+            else:
+                secrets = self._load_secrets()
+                self._validate_secrets(secrets)
+                _SECRETS_CACHE = (time.monotonic() + SECRETS_CACHE_TTL, secrets)
+                self._secrets_cache = secrets
         return self._secrets_cache
 
     def _load_secrets(self) -> Dict[str, str]:
         """Load all secrets from AWS Secrets Manager.
 
+        Secrets that are not found fall back to environment variables of
+        the same name.
+
         Returns:
             Dictionary of secrets
+
+        Raises:
+            ConfigError: If Secrets Manager fails other than by throttling
+                or a missing secret
         """
-        secrets_client = boto3.client('secretsmanager')
         secrets = {}
 
         secret_names = {
@@ -139,32 +262,119 @@ class Config:
             'SLACK_BOT_TOKEN': os.environ.get('SLACK_SECRET_NAME', 'SLACK_BOT_TOKEN')
         }
 
-        for key, secret_name in secret_names.items():
-            try:
-                response = secrets_client.get_secret_value(SecretId=secret_name)
-                secret_value = response['SecretString']
-
-                # Handle both plain string and JSON secrets
-                try:
-                    secret_dict = json.loads(secret_value)
-                    secrets[key] = secret_dict.get(key, secret_value)
-                except json.JSONDecodeError:
-                    secrets[key] = secret_value
-
-                logger.info(f"Successfully loaded secret: {secret_name}")
+        secret_strings = self._fetch_secret_strings(list(set(secret_names.values())))
 
-            except Exception as e:
-                logger.error(f"Failed to load secret {secret_name}: {e}")
+        for key, secret_name in secret_names.items():
+            if secret_name not in secret_strings:
                 # For local testing, allow fallback to environment variables
                 env_value = os.environ.get(key, '')
                 if env_value:
                     logger.warning(f"Using environment variable fallback for {key}")
-                    secrets[key] = env_value
-                else:
-                    secrets[key] = ''
+                secrets[key] = env_value
+                continue
+
+            secret_value = secret_strings[secret_name]
+            secrets[key] = secret_value
+
+            # Handle both plain string and JSON secrets. Plain API keys are
+            # the common case, so only values that look like a JSON object
+            # are parsed rather than paying for a failed parse on each one
+            if secret_value.lstrip().startswith('{'):
+                try:
+                    secrets[key] = json.loads(secret_value).get(key, secret_value)
+                except json.JSONDecodeError:
+                    pass
+
+            logger.info(f"Successfully loaded secret: {secret_name}")
 
         return secrets
 
+    def _fetch_secret_strings(self, secret_ids: List[str]) -> Dict[str, str]:
+        """Fetch several secrets from Secrets Manager in one round-trip.
+
+        Uses BatchGetSecretValue, falling back to concurrent
+        GetSecretValue calls when the role may not call the batch API.
+        Secrets that don't exist, and Secrets Manager being unreachable
+        (e.g. no credentials when running locally), are left out of the
+        result so callers can fall back to environment variables.
+
+        Args:
+            secret_ids: Secret names or ARNs
+
+        Returns:
+            Dictionary mapping each secret id that was found to its SecretString
+
+        Raises:
+            ConfigError: If Secrets Manager rejects a request for any other reason
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        try:
+            # Inside the try: building the client can fail too (e.g.
+            # NoRegionError when running locally)
+            secrets_client = get_client('secretsmanager')
+
+            try:
+                return self._batch_get_secrets(secrets_client, secret_ids)
+            except ClientError as e:
+                if _error_code(e) != 'AccessDeniedException':
+                    raise
+                logger.warning(f"Batch secret fetch denied: {e}. Fetching secrets individually")
+
+            def fetch(secret_id: str) -> Optional[str]:
+                try:
+                    response = _call_with_backoff(secrets_client.get_secret_value, SecretId=secret_id)
+                except ClientError as e:
+                    if _error_code(e) != 'ResourceNotFoundException':
+                        raise
+                    logger.error(f"Secret {secret_id} not found")
+                    return None
+                return response['SecretString']
+
+            with ThreadPoolExecutor(max_workers=len(secret_ids) or 1) as executor:
+                values = list(executor.map(fetch, secret_ids))
+
+            return {secret_id: value for secret_id, value in zip(secret_ids, values) if value is not None}
+
+        except BotoCoreError as e:
+            logger.warning(f"Secrets Manager unavailable: {e}")
+            return {}
+        except ClientError as e:
+            raise ConfigError(f"Failed to fetch secrets: {e}")
+
+    def _batch_get_secrets(self, secrets_client, secret_ids: List[str]) -> Dict[str, str]:
+        """Fetch secrets with a single BatchGetSecretValue call.
+
+        Args:
+            secrets_client: boto3 Secrets Manager client
+            secret_ids: Secret names or ARNs
+
+        Returns:
+            Dictionary mapping each secret id that was found to its SecretString
+
+        Raises:
+            ConfigError: If any secret failed for a reason other than not existing
+        """
+        response = _call_with_backoff(secrets_client.batch_get_secret_value, SecretIdList=secret_ids)
+
+        found = {}
+        for value in response.get('SecretValues', []):
+            # Callers may identify a secret by name or by ARN
+            found[value['Name']] = value['SecretString']
+            found[value['ARN']] = value['SecretString']
+
+        # Per-secret failures don't fail the batch. Missing secrets fall back
+        # to env vars upstream; anything else (access denied, KMS decryption
+        # failures, ...) is a deployment problem and must not be masked
+        for error in response.get('Errors', []):
+            code = error.get('ErrorCode')
+            message = f"{error.get('SecretId')}: {code} {error.get('Message', '')}"
+            if code != 'ResourceNotFoundException':
+                raise ConfigError(f"Failed to fetch secret {message}")
+            logger.error(f"Failed to fetch secret {message}")
+
+        return {secret_id: found[secret_id] for secret_id in secret_ids if secret_id in found}
+
     def _validate_secrets(self, secrets: Dict[str, str]) -> None:
         """Validate that all required secrets are present and non-empty.
 
@@ -207,11 +417,10 @@ class Config:
         try:
             if self.config_s3_bucket and self.config_s3_key:
                 accounts = self._load_accounts_from_s3()
-            elif config_path:
-                accounts = self._load_accounts_from_file(config_path)
             else:
                 # Default location
-                accounts = self._load_accounts_from_file('config/accounts.yaml')
+                path = self._compiled_path(config_path or 'config/accounts.yaml')
+                accounts = self._load_accounts_from_file(path)
 
             if not accounts:
                 raise ConfigError("No accounts configured")
@@ -224,6 +433,31 @@ class Config:
         except Exception as e:
             raise ConfigError(f"Failed to load accounts: {e}")
 
+    def _compiled_path(self, path: str) -> str:
+        """Prefer a precompiled JSON sibling of a YAML account file.
+
+        scripts/compile_accounts.py writes accounts.json next to
+        accounts.yaml at deploy time; it is used unless the YAML has been
+        edited since.
+
+        Args:
+            path: Path to the configured account file
+
+        Returns:
+            Path of the file to load
+        """
+        base, ext = os.path.splitext(path)
+        if ext not in ('.yaml', '.yml'):
+            return path
+
+        json_path = base + '.json'
+        if not os.path.exists(json_path):
+            return path
+        if os.path.exists(path) and os.path.getmtime(json_path) < os.path.getmtime(path):
+            logger.warning(f"{json_path} is older than {path}; loading YAML")
+            return path
+        return json_path
+
     def _load_accounts_from_file(self, path: str) -> List[AccountConfig]:
         """Load accounts from a local YAML or JSON file.
 
@@ -237,10 +471,16 @@ class Config:
             FileNotFoundError: If file doesn't exist
             ConfigError: If file format is invalid
         """
+        cache_key = f"file:{os.path.abspath(path)}"
+        version = str(os.stat(path).st_mtime_ns)
+        cached = _ACCOUNTS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == version:
+            return _copy_accounts(cached[1])
+
         try:
             with open(path, 'r') as f:
                 if path.endswith('.yaml') or path.endswith('.yml'):
-                    data = yaml.safe_load(f)
+                    data = _load_yaml(f)
                 else:
                     data = json.load(f)
 
@@ -251,37 +491,58 @@ class Config:
             if not isinstance(accounts, list):
                 raise ConfigError("'accounts' must be a list")
 
-            return [AccountConfig.from_dict(acc) for acc in accounts]
+            parsed = [AccountConfig.from_dict(acc) for acc in accounts]
+            _ACCOUNTS_CACHE[cache_key] = (version, parsed)
+            return _copy_accounts(parsed)
 
-        except yaml.YAMLError as e:
-            raise ConfigError(f"Invalid YAML format: {e}")
         except json.JSONDecodeError as e:
             raise ConfigError(f"Invalid JSON format: {e}")
 
     def _load_accounts_from_s3(self) -> List[AccountConfig]:
         """Load accounts from S3.
 
+        When the object was loaded before in this process, the request is
+        made conditional on its ETag; S3 answers 304 Not Modified without a
+        body if it hasn't changed and the cached accounts are reused.
+
         Returns:
             List of AccountConfig objects
 
         Raises:
             ConfigError: If S3 load fails
         """
+        from botocore.exceptions import ClientError
+
+        cache_key = f"s3://{self.config_s3_bucket}/{self.config_s3_key}"
+        cached = _ACCOUNTS_CACHE.get(cache_key)
+
         try:
-            s3_client = boto3.client('s3')
-            response = s3_client.get_object(
-                Bucket=self.config_s3_bucket,
-                Key=self.config_s3_key
-            )
-            content = response['Body'].read().decode('utf-8')
+            s3_client = get_client('s3')
+            request = {'Bucket': self.config_s3_bucket, 'Key': self.config_s3_key}
+            if cached is not None:
+                request['IfNoneMatch'] = cached[0]
+
+            try:
+                response = s3_client.get_object(**request)
+            except ClientError as e:
+                if cached is not None and e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+                    logger.info("Account configuration unchanged in S3; using cached accounts")
+                    return _copy_accounts(cached[1])
+                raise
+
+            # Parse straight from the streaming body; both parsers accept a
+            # binary file object, so the document is never held as a str
+            body = response['Body']
 
             if self.config_s3_key.endswith('.yaml') or self.config_s3_key.endswith('.yml'):
-                data = yaml.safe_load(content)
+                data = _load_yaml(body)
             else:
-                data = json.loads(content)
+                data = json.load(body)
 
             accounts = data.get('accounts', [])
-            return [AccountConfig.from_dict(acc) for acc in accounts]
+            parsed = [AccountConfig.from_dict(acc) for acc in accounts]
+            _ACCOUNTS_CACHE[cache_key] = (response['ETag'], parsed)
+            return _copy_accounts(parsed)
 
         except Exception as e:
             raise ConfigError(f"Failed to load accounts from S3: {e}")
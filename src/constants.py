@@ -4,6 +4,18 @@
 DEFAULT_NEWS_API_TIMEOUT = 10  # seconds
 DEFAULT_NEWS_API_MAX_RETRIES = 3
 DEFAULT_NEWS_MAX_PAGES = 5
+NEWS_API_PAGE_SIZE = 10  # max results per page on the Newsdata plan
+NEWS_API_POOL_MAXSIZE = 32  # keep-alive connections to newsdata.io
+NEWS_API_MAX_WORKERS = 8  # concurrent strategy fetches across accounts
+NEWS_QUERY_BATCH_SIZE = 8  # companies OR'd into one direct-mention query
+NEWS_API_MAX_QUERY_LENGTH = 512  # chars allowed in the q parameter
+NEWS_API_RATE_PER_SEC = 5  # client-side request rate to newsdata.io
+NEWS_API_BURST = 10  # requests allowed back-to-back before throttling
+NEWS_API_RETRY_BUDGET = 10  # retries allowed before failing fast on a degraded API
+NEWS_API_RETRY_REFILL = 0.5  # retry tokens regained per second
+NEWS_API_RETRY_SUCCESS_CREDIT = 0.1  # retry tokens regained per successful request
+NEWS_API_CACHE_SIZE = 512  # cached API pages per process
+NEWS_API_CACHE_TTL = 3600  # seconds a cached page stays fresh
 
 # Article Processing
 DEFAULT_DAYS_LOOKBACK = 7
@@ -18,15 +30,56 @@ DEFAULT_CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
 CLAUDE_MAX_TOKENS = 900
 CLAUDE_TEMPERATURE = 0.3
 CLAUDE_REQUEST_TIMEOUT = 60  # seconds
+CLAUDE_MAX_CONCURRENCY = 8  # parallel summarization requests
+CLAUDE_BATCH_MIN_REQUESTS = 5  # below this, per-call summarization is used
+CLAUDE_BATCH_POLL_INTERVAL = 10  # seconds between batch status checks
+CLAUDE_BATCH_MAX_WAIT = 120  # seconds; also cut short by the Lambda's remaining time
+CLAUDE_BATCH_CANCEL_WAIT = 20  # seconds to wait for a cancelled batch to end
+CLAUDE_COMBINED_MAX_ACCOUNTS = 6  # companies per combined summarization call
+CLAUDE_COMBINED_MAX_CHARS = 60000  # article text per combined call
+DEFAULT_SUMMARY_CACHE_PATH = "/tmp/claude_summaries.sqlite3"
+SUMMARY_CACHE_TTL_DAYS = 7
 
 # Slack API
 SLACK_MESSAGE_SIZE_LIMIT = 30000  # bytes (stay under 40KB limit)
 SLACK_MAX_LINKS_PER_ACCOUNT = 12
 SLACK_REQUEST_TIMEOUT = 30  # seconds
+SLACK_POST_RATE_PER_SEC = 1  # sustained chat.postMessage rate per channel
+SLACK_POST_BURST = 4  # posts allowed back-to-back before throttling
+SLACK_MAX_RETRIES = 3  # retries for rate-limited posts
+
+# Secrets
+SECRETS_CACHE_TTL = 900  # seconds warm invocations reuse loaded secrets
+SECRETS_MAX_ATTEMPTS = 4  # tries per Secrets Manager call when throttled
+SECRETS_BACKOFF_BASE = 0.2  # seconds before the first retry, doubled per attempt
+SECRETS_BACKOFF_MAX = 3.0  # cap on a single backoff sleep (seconds)
 
 # Persistence
+URL_HASH_SIZE = 8  # bytes in a URL hash digest (BLAKE2b-64)
+LEGACY_URL_KEY_LOOKUP = True  # also match pre-BLAKE2b-64 keys; disable one lookback window after deploy
 DYNAMODB_TTL_DAYS = 90  # Days to keep seen URLs
 S3_ARCHIVE_PREFIX = "briefs"
+SEEN_SNAPSHOT_DIR = "/tmp"  # warm-container snapshots of seen-URL history
+SEEN_SNAPSHOT_TTL = 60  # seconds a snapshot is trusted across invocations
+SEEN_BLOOM_PREFIX = "briefs/seen_bloom"  # per-account seen-URL Bloom filters in the archive bucket
+SEEN_BLOOM_CAPACITY = 100_000  # URLs per account before the false-positive rate degrades
+SEEN_BLOOM_ERROR_RATE = 0.001  # target false-positive rate (~180 KB per filter)
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # bytes; larger archives upload in parts
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # bytes per uploaded part
+S3_MAX_CONCURRENCY = 10  # parts transferred concurrently
+S3_RANGED_GET_THRESHOLD = 16 * 1024 * 1024  # bytes; larger archives download in ranges
+DYNAMODB_BATCH_GET_SIZE = 100  # BatchGetItem key limit per request
+DYNAMODB_BATCH_WRITE_SIZE = 25  # BatchWriteItem item limit per request
+DYNAMODB_WRITE_MAX_WORKERS = 16  # concurrent BatchWriteItem requests
+DYNAMODB_MAX_POOL_CONNECTIONS = 50  # botocore connection pool size (default is 10)
+DYNAMODB_MAX_ATTEMPTS = 10  # botocore attempts per request (adaptive retry mode)
+DYNAMODB_BATCH_MAX_RETRIES = 5  # retries for unprocessed batch keys
+DYNAMODB_WRITE_MAX_ATTEMPTS = 10  # BatchWriteItem attempts before unprocessed items are dropped
+DYNAMODB_BACKOFF_BASE = 0.05  # seconds before the first batch retry, doubled per retry
+DYNAMODB_BACKOFF_MAX = 2.0  # cap on a single batch backoff sleep (seconds)
+
+# Handler
+ACCOUNT_MAX_WORKERS = 8  # accounts filtered concurrently
 
 # Timeouts
 HTTP_REQUEST_TIMEOUT = 30  # seconds for generic HTTP requests
@@ -73,6 +126,10 @@ PRESS_WIRE_DOMAINS = [
     'bloomberg.com'
 ]
 
+# Joined once for query parameters
+PRESS_WIRE_DOMAINS_CSV = ','.join(PRESS_WIRE_DOMAINS)
+BLOCKED_NEWS_SOURCES_CSV = ','.join(BLOCKED_NEWS_SOURCES)
+
 # Source Priority for Sorting (higher = better)
 SOURCE_PRIORITY_MAP = {
     'reuters': 7,
@@ -96,7 +153,9 @@ ENV_CONFIG_S3_BUCKET = 'CONFIG_S3_BUCKET'
 ENV_CONFIG_S3_KEY = 'CONFIG_S3_KEY'
 ENV_USE_DYNAMODB = 'USE_DYNAMODB'
 ENV_DYNAMODB_TABLE = 'DYNAMODB_TABLE'
+ENV_DAX_ENDPOINT = 'DAX_ENDPOINT'
 ENV_ARCHIVE_S3_BUCKET = 'ARCHIVE_S3_BUCKET'
+ENV_SUMMARY_CACHE_PATH = 'SUMMARY_CACHE_PATH'
 
 # Secret Names
 SECRET_NEWS_DATA_API_KEY = 'NEWS_DATA_API_KEY'
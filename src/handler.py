@@ -1,15 +1,25 @@
 """Main Lambda handler for weekly account news automation."""
 import json
 import os
+import time
+import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config import Config
+from src.constants import ACCOUNT_MAX_WORKERS, LAMBDA_EXECUTION_BUFFER
 from src.clients.newsdata_client import NewsdataClient
 from src.clients.claude_client import ClaudeClient
 from src.clients.slack_client import SlackClient
 from src.utils.article_filter import ArticleFilter
 from src.utils.persistence import DynamoDBPersistence, S3Archiver
+from src.utils.summary_cache import SummaryCache
+from src.utils.logging_config import setup_logging, get_logger, log_with_context
+
+# Configured once per container; later invocations reuse the handler
+setup_logging()
+logger = get_logger(__name__)
 
 
 def lambda_handler(event: Dict, context) -> Dict:
@@ -22,8 +32,7 @@ def lambda_handler(event: Dict, context) -> Dict:
     Returns:
         Response dictionary
     """
-    print("=== Weekly Account News Automation Starting ===")
-    print(f"Event: {json.dumps(event)}")
+    log_with_context(logger, logging.INFO, "Weekly Account News Automation starting", event=event)
 
     # Load configuration
     config = Config()
@@ -31,20 +40,34 @@ def lambda_handler(event: Dict, context) -> Dict:
     # Check for dry run mode
     dry_run = event.get('dry_run', False)
     if dry_run:
-        print("*** DRY RUN MODE - Will not post to Slack ***")
+        logger.info("DRY RUN MODE - will not post to Slack")
+
+    # Summarization mode: 'parallel' (one call per account, concurrently),
+    # 'batch_api' (cheaper, slower Message Batches API), or 'combined'
+    # (several accounts per call)
+    summarize_mode = event.get('summarize_mode') or ('batch_api' if event.get('use_batch_api') else 'parallel')
 
     # Calculate run key for idempotency
     run_key = get_iso_week()
-    print(f"Run key (ISO week): {run_key}")
+    logger.info("Run key (ISO week): %s", run_key)
 
     # Initialize clients
     newsdata_client = NewsdataClient(
         api_key=config.secrets['NEWS_DATA_API_KEY']
     )
 
+    # Initialize summary cache (optional)
+    summary_cache = None
+    if config.summary_cache_path:
+        try:
+            summary_cache = SummaryCache(config.summary_cache_path)
+        except Exception as e:
+            logger.warning("Summary cache unavailable: %s", e)
+
     claude_client = ClaudeClient(
         api_key=config.secrets['ANTHROPIC_API_KEY'],
-        model=config.anthropic_model
+        model=config.anthropic_model,
+        cache=summary_cache
     )
 
     slack_client = SlackClient(
@@ -57,25 +80,31 @@ def lambda_handler(event: Dict, context) -> Dict:
         blocked_domains=config.blocked_domains
     )
 
-    # Initialize persistence (optional)
+    archive_bucket = os.environ.get('ARCHIVE_S3_BUCKET', '')
+
+    # Initialize persistence (optional); the archive bucket, if any, also
+    # holds the seen-URL Bloom filters
     persistence = None
     if config.use_dynamodb:
-        persistence = DynamoDBPersistence(config.dynamodb_table)
-        print(f"Using DynamoDB persistence: {config.dynamodb_table}")
+        persistence = DynamoDBPersistence(
+            config.dynamodb_table,
+            dax_endpoint=config.dax_endpoint,
+            bloom_bucket=archive_bucket
+        )
+        logger.info("Using DynamoDB persistence: %s", config.dynamodb_table)
 
     # Initialize archiver (optional)
     archiver = None
-    archive_bucket = os.environ.get('ARCHIVE_S3_BUCKET', '')
     if archive_bucket:
         archiver = S3Archiver(archive_bucket)
-        print(f"Using S3 archiving: {archive_bucket}")
+        logger.info("Using S3 archiving: %s", archive_bucket)
 
     # Load account configurations
     try:
         accounts = config.load_accounts()
-        print(f"Loaded {len(accounts)} accounts")
+        logger.info("Loaded %d accounts", len(accounts))
     except Exception as e:
-        print(f"Error loading accounts: {e}")
+        logger.error("Error loading accounts: %s", e)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': f'Failed to load accounts: {str(e)}'})
@@ -91,37 +120,79 @@ def lambda_handler(event: Dict, context) -> Dict:
         'errors': []
     }
 
-    for account in accounts:
-        try:
-            print(f"\n{'='*60}")
-            print(f"Processing: {account.company}")
-            print(f"{'='*60}")
-
-            summary = process_account(
+    # Fetch articles for all accounts
+    fetched_articles = newsdata_client.fetch_articles_for_accounts(
+        accounts=accounts,
+        days_lookback=config.days_lookback,
+        max_articles=config.articles_per_account * 3,  # Fetch more, filter down
+        timezone=config.timezone
+    )
+    newsdata_client.close()
+
+    # Filter articles for each account; the seen-URL lookups are network
+    # bound, so accounts are processed concurrently and collected in order
+    prepared = []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(accounts), ACCOUNT_MAX_WORKERS))) as executor:
+        futures = [
+            executor.submit(
+                collect_account_articles,
                 account=account,
-                newsdata_client=newsdata_client,
-                claude_client=claude_client,
+                articles=fetched_articles.get(account.company, []),
                 article_filter=article_filter,
                 persistence=persistence,
                 config=config
             )
+            for account in accounts
+        ]
+
+    for account, future in zip(accounts, futures):
+        try:
+            articles, articles_fetched = future.result()
+            prepared.append((account, articles, articles_fetched))
+
+        except Exception as e:
+            error_msg = f"Error processing {account.company}: {str(e)}"
+            logger.error(error_msg)
+            stats['errors'].append(error_msg)
+
+    # Summarize all accounts with Claude
+    logger.info("Summarizing %d accounts (%s)", len(prepared), summarize_mode)
+    jobs = [(account.company, articles) for account, articles, _ in prepared]
+    if summarize_mode == 'batch_api':
+        # Leave time after summarization to post to Slack and archive
+        deadline = None
+        if context is not None:
+            deadline = time.monotonic() + context.get_remaining_time_in_millis() / 1000 - LAMBDA_EXECUTION_BUFFER
+        summaries = claude_client.summarize_articles_batch(jobs, deadline=deadline)
+    elif summarize_mode == 'combined':
+        summaries = claude_client.summarize_accounts_batch(jobs)
+    else:
+        summaries = claude_client.summarize_many(jobs)
+
+    for (account, articles, articles_fetched), summary in zip(prepared, summaries):
+        try:
+            # Mark articles as seen if persistence is enabled
+            if persistence and articles:
+                url_hashes = [a.get('url_hash', '') for a in articles if a.get('url_hash')]
+                pub_dates = [a.get('pubDate', '') for a in articles if a.get('url_hash')]
+                persistence.mark_as_seen(account.company, url_hashes, pub_dates)
 
-            if summary:
-                all_summaries.append(summary)
-                stats['accounts_processed'] += 1
-                stats['total_articles_fetched'] += summary.get('articles_fetched', 0)
-                stats['total_articles_kept'] += summary.get('article_count', 0)
-                stats['total_tokens_used'] += summary.get('tokens_used', 0)
+            # Add metadata
+            summary['articles_fetched'] = articles_fetched
+
+            all_summaries.append(summary)
+            stats['accounts_processed'] += 1
+            stats['total_articles_fetched'] += summary.get('articles_fetched', 0)
+            stats['total_articles_kept'] += summary.get('article_count', 0)
+            stats['total_tokens_used'] += summary.get('tokens_used', 0)
 
         except Exception as e:
             error_msg = f"Error processing {account.company}: {str(e)}"
-            print(error_msg)
+            logger.error(error_msg)
             stats['errors'].append(error_msg)
 
     # Post to Slack
-    print(f"\n{'='*60}")
-    print("Posting to Slack...")
-    print(f"{'='*60}")
+    logger.info("Posting to Slack")
 
     slack_result = slack_client.post_weekly_brief(
         channel_id=config.slack_channel_id,
@@ -140,18 +211,17 @@ def lambda_handler(event: Dict, context) -> Dict:
         archiver.archive_brief(run_key, archive_content)
 
     # Build response
-    print(f"\n{'='*60}")
-    print("EXECUTION SUMMARY")
-    print(f"{'='*60}")
-    print(f"Accounts processed: {stats['accounts_processed']}/{len(accounts)}")
-    print(f"Total articles fetched: {stats['total_articles_fetched']}")
-    print(f"Total articles kept: {stats['total_articles_kept']}")
-    print(f"Total tokens used: {stats['total_tokens_used']}")
-    print(f"Slack post success: {slack_result.get('success', False)}")
-    if stats['errors']:
-        print(f"Errors: {len(stats['errors'])}")
-        for error in stats['errors']:
-            print(f"  - {error}")
+    log_with_context(
+        logger,
+        logging.WARNING if stats['errors'] else logging.INFO,
+        f"Execution summary: {stats['accounts_processed']}/{len(accounts)} accounts processed, "
+        f"{stats['total_articles_kept']}/{stats['total_articles_fetched']} articles kept, "
+        f"{stats['total_tokens_used']} tokens, {len(stats['errors'])} errors",
+        run_key=run_key,
+        accounts_total=len(accounts),
+        slack_success=slack_result.get('success', False),
+        **stats
+    )
 
     return {
         'statusCode': 200 if slack_result.get('success') else 500,
@@ -164,75 +234,54 @@ def lambda_handler(event: Dict, context) -> Dict:
     }
 
 
-def process_account(
+def collect_account_articles(
     account,
-    newsdata_client: NewsdataClient,
-    claude_client: ClaudeClient,
+    articles: List[Dict],
     article_filter: ArticleFilter,
     persistence,
     config: Config
-) -> Dict:
-    """Process a single account.
+) -> Tuple[List[Dict], int]:
+    """Filter the fetched articles for a single account.
 
     Args:
         account: AccountConfig object
-        newsdata_client: Newsdata.io client
-        claude_client: Claude client
+        articles: Raw articles fetched for the account
         article_filter: Article filter
         persistence: Optional persistence layer
         config: Configuration object
 
     Returns:
-        Summary dictionary
+        Tuple of (filtered articles, number of raw articles fetched)
     """
-    # Fetch articles
-    articles = newsdata_client.fetch_articles_for_account(
-        company=account.company,
-        website=account.website,
-        keywords=account.keywords,
-        newsroom=account.newsroom,
-        days_lookback=config.days_lookback,
-        max_articles=config.articles_per_account * 3,  # Fetch more, filter down
-        timezone=config.timezone
-    )
-
     articles_fetched = len(articles)
-    print(f"Fetched {articles_fetched} raw articles")
-
-    if not articles:
-        print("No articles found, generating empty summary")
-        return claude_client.summarize_articles(account.company, [])
-
-    # Filter unseen articles if persistence is enabled
-    if persistence:
-        unseen_articles = persistence.filter_unseen(account.company, articles)
-        print(f"After filtering seen URLs: {len(unseen_articles)} unseen articles")
-        articles = unseen_articles
-
-    # Filter and deduplicate
-    filtered_articles = article_filter.filter_and_dedupe(
-        articles=articles,
-        max_articles=config.articles_per_account
-    )
-
-    print(f"After filtering and deduplication: {len(filtered_articles)} articles")
-
-    # Summarize with Claude
-    summary = claude_client.summarize_articles(
-        company=account.company,
-        articles=filtered_articles
+    context = {'company': account.company, 'articles_fetched': articles_fetched}
+
+    if articles:
+        # Filter and deduplicate. With persistence the cap is applied after
+        # dropping seen URLs, which needs the url_hash set by this step
+        articles = article_filter.filter_and_dedupe(
+            articles=articles,
+            max_articles=len(articles) if persistence else config.articles_per_account,
+            stats=context
+        )
+
+        # Filter unseen articles if persistence is enabled
+        if persistence:
+            articles = persistence.filter_unseen(account.company, articles)
+            context['articles_unseen'] = len(articles)
+            articles = articles[:config.articles_per_account]
+
+    # One line per account; accounts run concurrently, so separate
+    # per-step lines would interleave
+    context['articles_kept'] = len(articles)
+    log_with_context(
+        logger,
+        logging.INFO,
+        f"{account.company}: fetched {articles_fetched} raw articles, kept {len(articles)}",
+        **context
     )
 
-    # Mark articles as seen if persistence is enabled
-    if persistence and filtered_articles:
-        url_hashes = [a.get('url_hash', '') for a in filtered_articles if a.get('url_hash')]
-        pub_dates = [a.get('pubDate', '') for a in filtered_articles if a.get('url_hash')]
-        persistence.mark_as_seen(account.company, url_hashes, pub_dates)
-
-    # Add metadata
-    summary['articles_fetched'] = articles_fetched
-
-    return summary
+    return articles, articles_fetched
 
 
 def get_iso_week() -> str:
@@ -1,11 +1,137 @@
 """Article filtering, deduplication, and canonicalization utilities."""
 import re
 import hashlib
-from typing import Dict, List, Set
+import functools
+from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from difflib import SequenceMatcher
 from datetime import datetime
 
+from src.constants import URL_HASH_SIZE
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Common tracking parameters stripped from article URLs
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid',
+    'ref', 'source', 'campaign',
+    '_ga', '_gl', 'mc_cid', 'mc_eid'
+})
+
+# Common prefixes/suffixes stripped from titles, applied in order
+_TITLE_NOISE_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'^breaking:\s*',
+        r'^exclusive:\s*',
+        r'^update:\s*',
+        r'\s*-\s*[^-]*$',  # Remove source suffix
+    )
+]
+
+
+# Syndicated stories repeat the same URLs and titles across accounts, so the
+# pure string helpers are memoized for the life of the process
+@functools.lru_cache(maxsize=4096)
+def _canonicalize_url(url: str) -> str:
+    """Remove the fragment and tracking parameters from a URL."""
+    if not url:
+        return url
+
+    # Drop the fragment, then filter the query string in place so the
+    # remaining parameters keep their original order and encoding
+    base = url.split('#', 1)[0]
+    if '?' not in base:
+        return base
+
+    base, query = base.split('?', 1)
+    kept = [
+        part for part in query.split('&')
+        if part and part.split('=', 1)[0].lower() not in _TRACKING_PARAMS
+    ]
+
+    return f"{base}?{'&'.join(kept)}" if kept else base
+
+
+def _legacy_canonicalize_url(url: str) -> str:
+    """Canonicalize a URL the way releases before BLAKE2b-64 hashing did."""
+    parsed = urlparse(url)
+    query_params = parse_qs(parsed.query, keep_blank_values=True)
+    filtered_params = {
+        k: v for k, v in query_params.items()
+        if k.lower() not in _TRACKING_PARAMS
+    }
+    new_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
+    return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, ''))
+
+
+@functools.lru_cache(maxsize=4096)
+def legacy_url_hash(url: str) -> str:
+    """Hex URL hash stored by earlier releases, for seen-URL lookups.
+
+    Items written before the switch to BLAKE2b-64 are keyed by the SHA-256
+    hash of the old canonical form.
+
+    Args:
+        url: Original article URL
+
+    Returns:
+        Hex SHA-256 digest, or an empty string for an empty URL
+    """
+    if not url:
+        return ''
+    return hashlib.sha256(_legacy_canonicalize_url(url).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and strip whitespace runs and wire prefixes/suffixes."""
+    # Convert to lowercase
+    normalized = title.lower()
+
+    # Remove extra whitespace
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
+
+    # Remove common prefixes/suffixes
+    for pattern in _TITLE_NOISE_RES:
+        normalized = pattern.sub('', normalized)
+
+    return normalized.strip()
+
+
+# Reputable sources in order of preference, matched as substrings of the
+# lowercased source name; earlier entries get a higher priority
+_REPUTABLE_SOURCES = (
+    'reuters', 'bloomberg', 'wall street journal', 'financial times',
+    'business wire', 'pr newswire', 'globe newswire'
+)
+_SOURCE_PRIORITY = tuple(
+    (name, len(_REPUTABLE_SOURCES) - idx) for idx, name in enumerate(_REPUTABLE_SOURCES)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _source_priority(source_name: str) -> int:
+    """Return the reputation priority of a source name (0 if not reputable)."""
+    source_name = source_name.lower()
+    for name, priority in _SOURCE_PRIORITY:
+        if name in source_name:
+            return priority
+    return 0
+
+
+def _pub_timestamp(pub_date_str: str) -> float:
+    """Parse a publication date to a POSIX timestamp (-inf if missing or invalid)."""
+    if not pub_date_str:
+        return float('-inf')
+    try:
+        return datetime.fromisoformat(pub_date_str.replace('Z', '+00:00')).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return float('-inf')
+
 
 class ArticleFilter:
     """Handles article filtering, deduplication, and URL canonicalization."""
@@ -23,48 +149,57 @@ class ArticleFilter:
             blocked_domains: List of blocked source domains
             similarity_threshold: Threshold for considering titles duplicates (0-1)
         """
-        self.allowed_domains = set(allowed_domains)
-        self.blocked_domains = set(blocked_domains)
         self.similarity_threshold = similarity_threshold
 
+        # A host matches a domain if it is the domain or a subdomain of it;
+        # str.endswith takes a tuple, so each check is a single C call
+        self._allowed_exact = frozenset(d.lower() for d in allowed_domains)
+        self._allowed_suffix = tuple('.' + d.lower() for d in allowed_domains)
+        self._blocked_exact = frozenset(d.lower() for d in blocked_domains)
+        self._blocked_suffix = tuple('.' + d.lower() for d in blocked_domains)
+
     def filter_and_dedupe(
         self,
         articles: List[Dict],
-        max_articles: int
+        max_articles: int,
+        stats: Optional[Dict[str, int]] = None
     ) -> List[Dict]:
         """Filter and deduplicate a list of articles.
 
         Args:
             articles: List of article dictionaries
             max_articles: Maximum number of articles to return
+            stats: Optional dict that receives the article counts after URL
+                and title deduplication, for the caller's per-account log line
 
         Returns:
             Filtered and deduplicated list of articles
         """
-        # Step 1: Canonicalize URLs
+        # Steps 1-3 in one pass: filter by domain policy, then canonicalize
+        # and remove URL duplicates. The domain check only needs the raw
+        # links, so rejected articles are never canonicalized or hashed
+        seen_urls: Set[bytes] = set()
+        url_unique = []
         for article in articles:
-            if 'link' in article:
-                article['canonical_url'] = self.canonicalize_url(article['link'])
-                article['url_hash'] = self._hash_url(article['canonical_url'])
-
-        # Step 2: Filter by domain policy
-        filtered = [a for a in articles if self._is_allowed_domain(a)]
-        print(f"After domain filtering: {len(filtered)} articles")
+            if not self._is_allowed_domain(article):
+                continue
 
-        # Step 3: Remove URL duplicates
-        seen_urls = set()
-        url_unique = []
-        for article in filtered:
-            url_hash = article.get('url_hash', '')
-            if url_hash and url_hash not in seen_urls:
-                seen_urls.add(url_hash)
-                url_unique.append(article)
+            canonical_url = self.canonicalize_url(article['link'])
+            url_hash = self._hash_url(canonical_url)
+            if url_hash in seen_urls:
+                continue
 
-        print(f"After URL deduplication: {len(url_unique)} articles")
+            article['canonical_url'] = canonical_url
+            article['url_hash'] = url_hash
+            seen_urls.add(url_hash)
+            url_unique.append(article)
 
         # Step 4: Remove near-duplicate titles
         title_unique = self._remove_duplicate_titles(url_unique)
-        print(f"After title deduplication: {len(title_unique)} articles")
+
+        if stats is not None:
+            stats['articles_url_unique'] = len(url_unique)
+            stats['articles_title_unique'] = len(title_unique)
 
         # Step 5: Sort by publication date (newest first) and quality
         sorted_articles = self._sort_by_quality(title_unique)
@@ -81,54 +216,22 @@ class ArticleFilter:
         Returns:
             Canonicalized URL
         """
-        if not url:
-            return url
-
-        # Parse URL
-        parsed = urlparse(url)
-
-        # Remove common tracking parameters
-        tracking_params = {
-            'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-            'fbclid', 'gclid', 'msclkid',
-            'ref', 'source', 'campaign',
-            '_ga', '_gl', 'mc_cid', 'mc_eid'
-        }
-
-        # Parse query string
-        query_params = parse_qs(parsed.query, keep_blank_values=True)
-
-        # Filter out tracking parameters
-        filtered_params = {
-            k: v for k, v in query_params.items()
-            if k.lower() not in tracking_params
-        }
-
-        # Rebuild query string
-        new_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
-
-        # Rebuild URL
-        canonical = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            ''  # Remove fragment
-        ))
-
-        return canonical
-
-    def _hash_url(self, url: str) -> str:
+        return _canonicalize_url(url)
+
+    def _hash_url(self, url: str) -> bytes:
         """Create a hash of a URL for deduplication.
 
         Args:
             url: URL to hash
 
         Returns:
-            SHA256 hash of the URL
+            Raw 64-bit BLAKE2b digest of the URL
         """
-        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+        # Dedup only needs collision resistance among a few thousand URLs per
+        # account; raw 8-byte digests keep seen sets small and cheap to probe.
+        # DynamoDB stores them as Binary, hex-encoded only in the sort key
+        # (see persistence)
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=URL_HASH_SIZE).digest()
 
     def _is_allowed_domain(self, article: Dict) -> bool:
         """Check if an article's source domain is allowed.
@@ -144,39 +247,44 @@ class ArticleFilter:
             return False
 
         try:
-            domain = urlparse(url).netloc.lower()
-
-            # Remove www prefix for matching
-            domain = domain.replace('www.', '')
+            domain = self._host(url)
 
             # Check blocklist first
-            for blocked in self.blocked_domains:
-                if blocked in domain:
-                    return False
+            if domain in self._blocked_exact or domain.endswith(self._blocked_suffix):
+                return False
 
             # If allowlist is empty, allow all (except blocked)
-            if not self.allowed_domains:
+            if not self._allowed_exact:
                 return True
 
             # Check allowlist
-            for allowed in self.allowed_domains:
-                if allowed in domain:
-                    return True
+            if domain in self._allowed_exact or domain.endswith(self._allowed_suffix):
+                return True
 
             # Also allow the source_url domain if present
             source_url = article.get('source_url', '')
             if source_url:
-                source_domain = urlparse(source_url).netloc.lower().replace('www.', '')
-                for allowed in self.allowed_domains:
-                    if allowed in source_domain:
-                        return True
+                source_domain = self._host(source_url)
+                if source_domain in self._allowed_exact or source_domain.endswith(self._allowed_suffix):
+                    return True
 
             return False
 
         except Exception as e:
-            print(f"Error parsing domain: {e}")
+            logger.warning("Error parsing domain of %s: %s", article.get('link'), e)
             return False
 
+    def _host(self, url: str) -> str:
+        """Extract the lowercase host from a URL, without port or leading 'www.'.
+
+        Args:
+            url: URL to parse
+
+        Returns:
+            Host name (e.g. 'reuters.com')
+        """
+        return urlparse(url).netloc.lower().split(':')[0].removeprefix('www.')
+
     def _remove_duplicate_titles(self, articles: List[Dict]) -> List[Dict]:
         """Remove articles with near-duplicate titles.
 
@@ -187,44 +295,41 @@ class ArticleFilter:
             List with duplicate titles removed
         """
         unique = []
-        seen_titles = []
+        threshold = self.similarity_threshold
+
+        # One matcher per kept title, with the kept title as the second
+        # sequence: SequenceMatcher caches its index of seq2, so each kept
+        # title is indexed once instead of once per comparison
+        seen_matchers: List[SequenceMatcher] = []
 
         for article in articles:
             title = article.get('title', '').lower().strip()
             if not title:
                 continue
 
-            # Check against all seen titles
+            normalized = self._normalize_title(title)
+
+            # Check against all seen titles; the cheap upper bounds rule out
+            # most pairs before the full ratio is computed
             is_duplicate = False
-            for seen_title in seen_titles:
-                similarity = self._title_similarity(title, seen_title)
-                if similarity >= self.similarity_threshold:
+            for matcher in seen_matchers:
+                matcher.set_seq1(normalized)
+                if (
+                    matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold
+                    and matcher.ratio() >= threshold
+                ):
                     is_duplicate = True
                     break
 
             if not is_duplicate:
                 unique.append(article)
-                seen_titles.append(title)
+                matcher = SequenceMatcher(None)
+                matcher.set_seq2(normalized)
+                seen_matchers.append(matcher)
 
         return unique
 
-    def _title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate similarity between two titles.
-
-        Args:
-            title1: First title
-            title2: Second title
-
-        Returns:
-            Similarity score between 0 and 1
-        """
-        # Normalize titles
-        t1 = self._normalize_title(title1)
-        t2 = self._normalize_title(title2)
-
-        # Use SequenceMatcher for similarity
-        return SequenceMatcher(None, t1, t2).ratio()
-
     def _normalize_title(self, title: str) -> str:
         """Normalize a title for comparison.
 
@@ -234,23 +339,7 @@ class ArticleFilter:
         Returns:
             Normalized title
         """
-        # Convert to lowercase
-        normalized = title.lower()
-
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-
-        # Remove common prefixes/suffixes
-        patterns = [
-            r'^breaking:\s*',
-            r'^exclusive:\s*',
-            r'^update:\s*',
-            r'\s*-\s*[^-]*$',  # Remove source suffix
-        ]
-        for pattern in patterns:
-            normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
-
-        return normalized.strip()
+        return _normalize_title(title)
 
     def _sort_by_quality(self, articles: List[Dict]) -> List[Dict]:
         """Sort articles by quality and recency.
@@ -261,31 +350,11 @@ class ArticleFilter:
         Returns:
             Sorted list of articles
         """
-        def quality_score(article: Dict) -> tuple:
-            """Calculate quality score for sorting."""
-            # Parse publication date
-            pub_date_str = article.get('pubDate', '')
-            try:
-                if pub_date_str:
-                    pub_date = datetime.fromisoformat(pub_date_str.replace('Z', '+00:00'))
-                else:
-                    pub_date = datetime.min
-            except:
-                pub_date = datetime.min
-
-            # Prefer reputable sources
-            source_priority = 0
-            source_name = article.get('source_name', '').lower()
-            reputable_sources = [
-                'reuters', 'bloomberg', 'wall street journal', 'financial times',
-                'business wire', 'pr newswire', 'globe newswire'
-            ]
-            for idx, rep_source in enumerate(reputable_sources):
-                if rep_source in source_name:
-                    source_priority = len(reputable_sources) - idx
-                    break
-
-            # Return tuple for sorting (higher values first, except date which is reversed)
-            return (-pub_date.timestamp(), -source_priority)
-
-        return sorted(articles, key=quality_score)
+        # Newest first, then by source reputation; undated articles sort last
+        return sorted(
+            articles,
+            key=lambda a: (
+                -_pub_timestamp(a.get('pubDate', '')),
+                -_source_priority(a.get('source_name', ''))
+            )
+        )
@@ -0,0 +1,91 @@
+"""Shared AWS clients for the weekly news automation."""
+import threading
+from typing import Any, Dict
+
+from src.constants import DYNAMODB_MAX_POOL_CONNECTIONS, DYNAMODB_MAX_ATTEMPTS
+
+# botocore Config arguments for services that need more than the defaults.
+# DynamoDB batch writes are issued from a thread pool, which the default
+# pool of 10 connections would serialize
+_SERVICE_CONFIG: Dict[str, Dict[str, Any]] = {
+    'dynamodb': {
+        'max_pool_connections': DYNAMODB_MAX_POOL_CONNECTIONS,
+        'retries': {'mode': 'adaptive', 'max_attempts': DYNAMODB_MAX_ATTEMPTS},
+    },
+}
+
+# One explicit session backs every client and resource, so credentials and
+# service models are resolved once per container and nothing depends on
+# boto3's replaceable default session
+_session: Any = None
+_clients: Dict[str, Any] = {}
+_resources: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_session() -> Any:
+    """Return the shared boto3 session, creating it on first use (lock held)."""
+    global _session
+    if _session is None:
+        # Imported here so modules that never touch AWS don't pay boto3's
+        # import cost on cold start
+        import boto3
+        _session = boto3.session.Session()
+    return _session
+
+
+def _config(service_name: str) -> Any:
+    """Build the botocore Config for a service, or None for the defaults."""
+    options = _SERVICE_CONFIG.get(service_name)
+    if options is None:
+        return None
+
+    from botocore.config import Config
+    return Config(**options)
+
+
+def get_client(service_name: str) -> Any:
+    """Return a process-wide boto3 client for a service.
+
+    Building a client resolves credentials and endpoints, which is slow,
+    so each client is created once and reused across warm Lambda
+    invocations.
+
+    Args:
+        service_name: AWS service name (e.g. 's3', 'secretsmanager')
+
+    Returns:
+        boto3 client
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        # boto3 sessions are not safe to use from several threads at once,
+        # so creation is serialized
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _get_session().client(service_name, config=_config(service_name))
+                _clients[service_name] = client
+    return client
+
+
+def get_resource(service_name: str) -> Any:
+    """Return a process-wide boto3 resource for a service.
+
+    Resources are not thread-safe; share them across invocations, not
+    across threads.
+
+    Args:
+        service_name: AWS service name (e.g. 'dynamodb')
+
+    Returns:
+        boto3 service resource
+    """
+    resource = _resources.get(service_name)
+    if resource is None:
+        with _clients_lock:
+            resource = _resources.get(service_name)
+            if resource is None:
+                resource = _get_session().resource(service_name, config=_config(service_name))
+                _resources[service_name] = resource
+    return resource
@@ -0,0 +1,107 @@
+"""Compact Bloom filter for seen-URL digests."""
+import math
+import struct
+from typing import List
+
+# Serialized form: number of bits, number of hash functions, then the bit array
+_HEADER = struct.Struct('>QB')
+
+
+class BloomFilter:
+    """Bloom filter over URL hash digests.
+
+    Keys are BLAKE2b digests (see ArticleFilter._hash_url), which are
+    already uniformly distributed, so the bit positions are derived from
+    the digest by double hashing instead of hashing the key again.
+    Membership tests have no false negatives; false positives occur at
+    roughly the configured error rate until the filter is over capacity.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: bytearray = None):
+        """Initialize the filter.
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Number of bit positions set per key
+            bits: Existing bit array (empty filter if omitted)
+        """
+        if num_bits <= 0 or num_hashes <= 0:
+            raise ValueError("num_bits and num_hashes must be positive")
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> 'BloomFilter':
+        """Create an empty filter sized for a number of keys.
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate at capacity (0-1)
+
+        Returns:
+            Empty BloomFilter
+        """
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """Deserialize a filter written by to_bytes.
+
+        Args:
+            data: Serialized filter
+
+        Returns:
+            BloomFilter
+
+        Raises:
+            ValueError: If the data is truncated or malformed
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Bloom filter data is truncated")
+
+        num_bits, num_hashes = _HEADER.unpack_from(data)
+        bits = bytearray(data[_HEADER.size:])
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError("Bloom filter size does not match its header")
+        return cls(num_bits, num_hashes, bits)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter.
+
+        Returns:
+            Header followed by the bit array
+        """
+        return _HEADER.pack(self.num_bits, self.num_hashes) + bytes(self.bits)
+
+    def _positions(self, digest: bytes) -> List[int]:
+        """Bit positions for a digest (at least 8 bytes)."""
+        h1 = int.from_bytes(digest[:4], 'big')
+        # Odd step so the positions don't collapse when num_bits is even
+        h2 = int.from_bytes(digest[4:8], 'big') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, digest: bytes) -> None:
+        """Add a digest to the filter.
+
+        Args:
+            digest: Raw URL hash digest
+        """
+        bits = self.bits
+        for position in self._positions(digest):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Check whether a digest may have been added.
+
+        Args:
+            digest: Raw URL hash digest
+
+        Returns:
+            False if the digest was definitely never added
+        """
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
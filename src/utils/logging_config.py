@@ -1,31 +1,98 @@
 """Structured logging configuration for the weekly news automation."""
 import logging
-import json
 import sys
+import time
 from typing import Any, Dict
 
+import orjson
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs JSON-structured logs."""
 
+    # (second, formatted timestamp up to that second) of the last record;
+    # consecutive records usually share it, so strftime runs once a second
+    _time_cache = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format the record time, reusing the formatted second when possible."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        return self.format_bytes(record).decode('utf-8')
+
+    def format_bytes(self, record: logging.LogRecord, option: int = 0) -> bytes:
+        """Format log record as UTF-8 encoded JSON.
+
+        Args:
+            record: Log record
+            option: orjson option flags (e.g. orjson.OPT_APPEND_NEWLINE)
+
+        Returns:
+            Encoded JSON document
+        """
+        # Most records are plain strings without %-args; skip the
+        # str()/% round-trip in getMessage for those
+        message = record.msg
+        if record.args or type(message) is not str:
+            message = record.getMessage()
+
         log_data: Dict[str, Any] = {
             'timestamp': self.formatTime(record, self.datefmt),
             'level': record.levelname,
             'logger': record.name,
-            'message': record.getMessage(),
+            'message': message,
         }
 
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
 
-        # Add any extra fields
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
+        # Add any extra fields (one dict probe instead of hasattr + getattr)
+        extra_fields = record.__dict__.get('extra_fields')
+        if extra_fields:
+            log_data.update(extra_fields)
 
-        return json.dumps(log_data)
+        # orjson emits compact UTF-8 JSON; values it can't encode natively
+        # are logged as their str() instead of failing the log call
+        return orjson.dumps(log_data, default=str, option=option)
+
+
+class JSONStreamHandler(logging.StreamHandler):
+    """Stream handler that writes StructuredFormatter output as bytes.
+
+    orjson already produces UTF-8, so each record is written straight to
+    the stream's binary buffer instead of being decoded to str and
+    re-encoded by the text layer.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record as one newline-terminated JSON line."""
+        buffer = getattr(self.stream, 'buffer', None)
+        if buffer is None or not isinstance(self.formatter, StructuredFormatter):
+            super().emit(record)
+            return
+
+        try:
+            data = self.formatter.format_bytes(record, orjson.OPT_APPEND_NEWLINE)
+            # Push out any text already written to the stream (e.g. by
+            # print) so lines stay in order
+            self.stream.flush()
+            buffer.write(data)
+            buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -44,19 +111,22 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     # Remove existing handlers
     logger.handlers = []
 
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
+    # Don't also emit through the root logger (which the Lambda runtime
+    # configures), or every line would be written twice
+    logger.propagate = False
 
     # Use structured formatter for production, simple for local
     if sys.stdout.isatty():
         # Local development - use simple format
+        handler = logging.StreamHandler(sys.stdout)
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
     else:
         # Production - use JSON format
+        handler = JSONStreamHandler(sys.stdout)
         formatter = StructuredFormatter()
+    handler.setLevel(level)
 
     handler.setFormatter(formatter)
     logger.addHandler(handler)
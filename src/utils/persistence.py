@@ -1,103 +1,373 @@
 """Persistence layer for tracking seen articles."""
-import boto3
-from typing import List, Set
+import io
+import os
+import time
+import codecs
+import random
+import logging
+import functools
+from typing import Dict, FrozenSet, List, Optional, Set, TextIO, Tuple
+from urllib.parse import quote
 from datetime import datetime, timedelta
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import BotoCoreError, ClientError
+
+from src.constants import (
+    URL_HASH_SIZE,
+    LEGACY_URL_KEY_LOOKUP,
+    DYNAMODB_TTL_DAYS,
+    DYNAMODB_BATCH_GET_SIZE,
+    DYNAMODB_BATCH_WRITE_SIZE,
+    DYNAMODB_WRITE_MAX_WORKERS,
+    DYNAMODB_BATCH_MAX_RETRIES,
+    DYNAMODB_WRITE_MAX_ATTEMPTS,
+    DYNAMODB_BACKOFF_BASE,
+    DYNAMODB_BACKOFF_MAX,
+    S3_MULTIPART_THRESHOLD,
+    S3_MULTIPART_CHUNKSIZE,
+    S3_MAX_CONCURRENCY,
+    S3_RANGED_GET_THRESHOLD,
+    SEEN_SNAPSHOT_DIR,
+    SEEN_SNAPSHOT_TTL,
+    SEEN_BLOOM_PREFIX,
+    SEEN_BLOOM_CAPACITY,
+    SEEN_BLOOM_ERROR_RATE,
+)
+from src.utils.article_filter import legacy_url_hash
+from src.utils.aws import get_client, get_resource
+from src.utils.bloom import BloomFilter
+from src.utils.logging_config import get_logger, log_with_context
+
+logger = get_logger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _transfer_config():
+    """Return the shared S3 TransferConfig (boto3 is imported on first use)."""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=S3_MAX_CONCURRENCY,
+        use_threads=True
+    )
+
+
+def _backoff(attempt: int) -> None:
+    """Sleep before retrying unprocessed batch work (capped, jittered)."""
+    delay = min(DYNAMODB_BACKOFF_MAX, DYNAMODB_BACKOFF_BASE * 2 ** attempt)
+    time.sleep(random.uniform(0, delay))
 
 
 class DynamoDBPersistence:
     """DynamoDB-based persistence for tracking seen article URLs."""
 
-    def __init__(self, table_name: str):
+    def __init__(self, table_name: str, dax_endpoint: str = '', bloom_bucket: str = ''):
         """Initialize the persistence layer.
 
         Args:
             table_name: DynamoDB table name
+            dax_endpoint: Optional DAX cluster endpoint; when set, seen-URL
+                reads go through DAX while writes go to DynamoDB directly
+            bloom_bucket: Optional S3 bucket holding per-account Bloom
+                filters of seen URLs; when set, only articles the filter
+                may have seen are looked up in DynamoDB
         """
         self.table_name = table_name
-        self.dynamodb = boto3.resource('dynamodb')
+        self.bloom_bucket = bloom_bucket
+        # Bloom filters loaded during this run, by account (None if unavailable),
+        # and the ETag of each filter's S3 object (None if not stored yet)
+        self._blooms: Dict[str, Optional[BloomFilter]] = {}
+        self._bloom_etags: Dict[str, Optional[str]] = {}
+        # Seen-URL histories queried during this run, by account
+        self._seen_cache: Dict[str, FrozenSet[bytes]] = {}
+        self.dynamodb = get_resource('dynamodb')
         self.table = self.dynamodb.Table(table_name)
 
-    def mark_as_seen(self, account: str, url_hashes: List[str], pub_dates: List[str]) -> None:
+        # Reads default to the table itself
+        self.reader = self.dynamodb
+        self.reader_table = self.table
+        if dax_endpoint:
+            self._use_dax(dax_endpoint)
+
+    def _use_dax(self, endpoint: str) -> None:
+        """Route reads through a DAX cluster if the DAX client is installed.
+
+        Args:
+            endpoint: DAX cluster endpoint (e.g. 'dax://my-cluster.xxxx.dax-clusters.us-east-1.amazonaws.com')
+        """
+        try:
+            from amazondax import AmazonDaxClient
+        except ImportError:
+            logger.warning("DAX_ENDPOINT is set but amazon-dax-client is not installed; reading from DynamoDB")
+            return
+
+        try:
+            self.reader = AmazonDaxClient.resource(endpoint_url=endpoint)
+            self.reader_table = self.reader.Table(self.table_name)
+            logger.info("Reading seen URLs through DAX: %s", endpoint)
+        except Exception as e:
+            log_with_context(
+                logger, logging.WARNING, "Error connecting to DAX, reading from DynamoDB",
+                endpoint=endpoint, error=str(e)
+            )
+
+    def mark_as_seen(self, account: str, url_hashes: List[bytes], pub_dates: List[str]) -> None:
         """Mark URLs as seen for an account.
 
         Args:
             account: Company/account name
-            url_hashes: List of URL hashes
+            url_hashes: List of raw URL hash digests
             pub_dates: List of publication dates
         """
         if not url_hashes:
             return
 
-        # Calculate TTL (90 days from now)
-        ttl = int((datetime.utcnow() + timedelta(days=90)).timestamp())
-
-        # Batch write items
-        with self.table.batch_writer() as batch:
-            for url_hash, pub_date in zip(url_hashes, pub_dates):
-                try:
-                    batch.put_item(
-                        Item={
-                            'pk': f"ACCOUNT#{account}",
-                            'sk': f"URL#{url_hash}",
-                            'account': account,
-                            'url_hash': url_hash,
-                            'pub_date': pub_date,
-                            'seen_at': datetime.utcnow().isoformat(),
-                            'ttl': ttl
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error marking URL as seen: {e}")
-
-    def get_seen_urls(self, account: str) -> Set[str]:
+        # Attributes shared by every item in the batch, including the seen
+        # time and TTL (90 days from now), are built once
+        now = datetime.utcnow()
+        static = {
+            'pk': f"ACCOUNT#{account}",
+            'account': account,
+            'seen_at': now.isoformat(),
+            'ttl': int((now + timedelta(days=DYNAMODB_TTL_DAYS)).timestamp())
+        }
+
+        # The Bloom filter is updated and uploaded before DynamoDB is written.
+        # A filter holding hashes that never reached the table only costs an
+        # extra lookup, while one missing written hashes would let seen
+        # articles through as new
+        if self.bloom_bucket:
+            bloom = self._get_bloom(account)
+            if bloom is not None:
+                for url_hash in url_hashes:
+                    bloom.add(url_hash)
+                self._save_bloom(account, bloom)
+
+        items = []
+        # The sort key is a string attribute, so it carries the hex form;
+        # url_hash itself is stored as an 8-byte Binary value
+        for url_hash, pub_date in zip(url_hashes, pub_dates):
+            items.append({**static, 'sk': f"URL#{url_hash.hex()}", 'url_hash': url_hash, 'pub_date': pub_date})
+
+        # BatchWriteItem takes 25 items per request; the requests are
+        # independent, so they are sent concurrently
+        chunks = [
+            items[start:start + DYNAMODB_BATCH_WRITE_SIZE]
+            for start in range(0, len(items), DYNAMODB_BATCH_WRITE_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(DYNAMODB_WRITE_MAX_WORKERS, len(chunks))) as executor:
+            results = list(executor.map(self._write_chunk, chunks))
+
+        # Unwritten items are only re-reported as new next week, so they are
+        # logged once for the account rather than failing the run
+        unwritten = sum(count for count, _ in results)
+        if unwritten:
+            log_with_context(
+                logger,
+                logging.ERROR,
+                "Failed to mark URLs as seen",
+                account=account,
+                table=self.table_name,
+                batch_size=len(items),
+                unwritten=unwritten,
+                errors=sorted({error for _, error in results if error})
+            )
+
+        # The account's history just changed
+        self._seen_cache.pop(account, None)
+        try:
+            os.remove(self._snapshot_path(account))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Error removing seen-URL snapshot: %s", e)
+
+    def _write_chunk(self, items: List[Dict]) -> Tuple[int, Optional[str]]:
+        """Write up to 25 items with BatchWriteItem.
+
+        Unprocessed items (returned when the table is throttled) are
+        retried with capped exponential backoff and jitter, up to
+        DYNAMODB_WRITE_MAX_ATTEMPTS requests in total.
+
+        Args:
+            items: Items to put
+
+        Returns:
+            Tuple of (number of items not written, error description or None)
+        """
+        # The resource's low-level client is thread-safe and still accepts
+        # plain Python values
+        client = self.dynamodb.meta.client
+        request = {self.table_name: [{'PutRequest': {'Item': item}} for item in items]}
+
+        try:
+            for attempt in range(DYNAMODB_WRITE_MAX_ATTEMPTS):
+                response = client.batch_write_item(RequestItems=request)
+                request = response.get('UnprocessedItems')
+                if not request:
+                    return 0, None
+                if attempt < DYNAMODB_WRITE_MAX_ATTEMPTS - 1:
+                    _backoff(attempt)
+        except ClientError as e:
+            return len(items), e.response.get('Error', {}).get('Code') or str(e)
+        except BotoCoreError as e:
+            return len(items), str(e)
+
+        return (
+            len(request[self.table_name]),
+            f"UnprocessedItems after {DYNAMODB_WRITE_MAX_ATTEMPTS} attempts"
+        )
+
+    def get_seen_urls(self, account: str) -> FrozenSet[bytes]:
         """Get all seen URL hashes for an account.
 
+        This reads the account's whole history, so it is meant for
+        inspection and maintenance; use filter_unseen to check articles.
+
         Args:
             account: Company/account name
 
         Returns:
-            Set of seen URL hashes
+            Set of seen URL hash digests
         """
-        seen = set()
-        pk = f"ACCOUNT#{account}"
-
         try:
-            response = self.table.query(
-                KeyConditionExpression='pk = :pk AND begins_with(sk, :sk_prefix)',
-                ExpressionAttributeValues={
-                    ':pk': pk,
-                    ':sk_prefix': 'URL#'
-                },
-                ProjectionExpression='url_hash'
+            return self._query_seen_urls(account)
+        except (ClientError, BotoCoreError) as e:
+            log_with_context(
+                logger, logging.ERROR, "Error querying seen URLs",
+                account=account, table=self.table_name, error=str(e)
             )
+            return frozenset()
 
-            for item in response.get('Items', []):
-                seen.add(item['url_hash'])
+    def _query_seen_urls(self, account: str) -> FrozenSet[bytes]:
+        """Get all seen URL hashes for an account, memoized.
 
-            # Handle pagination if needed
-            while 'LastEvaluatedKey' in response:
-                response = self.table.query(
-                    KeyConditionExpression='pk = :pk AND begins_with(sk, :sk_prefix)',
-                    ExpressionAttributeValues={
-                        ':pk': pk,
-                        ':sk_prefix': 'URL#'
-                    },
-                    ProjectionExpression='url_hash',
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
+        Results are kept for the rest of the run, and snapshotted to /tmp
+        so a warm container reuses them for SEEN_SNAPSHOT_TTL seconds.
+        mark_as_seen invalidates both for the account it writes.
 
-                for item in response.get('Items', []):
-                    seen.add(item['url_hash'])
+        Args:
+            account: Company/account name
 
-        except ClientError as e:
-            print(f"Error querying seen URLs: {e}")
+        Returns:
+            Set of seen URL hash digests
 
+        Raises:
+            ClientError: If the query fails
+            BotoCoreError: If the request can't be sent
+        """
+        seen = self._seen_cache.get(account)
+        if seen is None:
+            seen = self._load_snapshot(account)
+            if seen is None:
+                seen = frozenset(self._fetch_seen_urls(account))
+                self._save_snapshot(account, seen)
+            self._seen_cache[account] = seen
         return seen
 
+    def _snapshot_path(self, account: str) -> str:
+        """Path of an account's seen-URL snapshot in /tmp."""
+        name = f"seen_{quote(self.table_name, safe='')}_{quote(account, safe='')}.bin"
+        return os.path.join(SEEN_SNAPSHOT_DIR, name)
+
+    def _load_snapshot(self, account: str) -> Optional[FrozenSet[bytes]]:
+        """Load an account's seen-URL snapshot if it is fresh.
+
+        Args:
+            account: Company/account name
+
+        Returns:
+            Set of seen URL hash digests, or None if missing, stale, or unreadable
+        """
+        path = self._snapshot_path(account)
+        try:
+            if time.time() - os.path.getmtime(path) > SEEN_SNAPSHOT_TTL:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Ignoring unreadable seen-URL snapshot %s: %s", path, e)
+            return None
+
+        if len(data) % URL_HASH_SIZE:
+            logger.warning("Ignoring truncated seen-URL snapshot %s", path)
+            return None
+
+        view = memoryview(data)
+        return frozenset(view[i:i + URL_HASH_SIZE].tobytes() for i in range(0, len(data), URL_HASH_SIZE))
+
+    def _save_snapshot(self, account: str, seen: FrozenSet[bytes]) -> None:
+        """Write an account's seen-URL snapshot (atomically) as raw digests.
+
+        Args:
+            account: Company/account name
+            seen: Set of seen URL hash digests
+        """
+        path = self._snapshot_path(account)
+        try:
+            # Digests are fixed-size, so the snapshot is just their
+            # concatenation: no framing and nothing to parse on load
+            with open(path + '.tmp', 'wb') as f:
+                f.write(b''.join(seen))
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            logger.warning("Error writing seen-URL snapshot %s: %s", path, e)
+
+    def _fetch_seen_urls(self, account: str) -> Set[bytes]:
+        """Query all seen URL hashes for an account from DynamoDB.
+
+        Args:
+            account: Company/account name
+
+        Returns:
+            Set of seen URL hash digests
+
+        Raises:
+            ClientError: If the query fails
+            BotoCoreError: If the request can't be sent
+        """
+        seen = set()
+        query = {
+            'KeyConditionExpression': 'pk = :pk AND begins_with(sk, :sk_prefix)',
+            'ExpressionAttributeValues': {
+                ':pk': f"ACCOUNT#{account}",
+                ':sk_prefix': 'URL#'
+            },
+            # Read the hash back from the sort key, which is hex in every
+            # item, including those written before url_hash became Binary
+            'ProjectionExpression': 'sk'
+        }
+
+        # Keys written before the switch to BLAKE2b-64 (hex SHA-256) can
+        # never match a current hash, and would be split into junk entries
+        # by the fixed-width snapshot, so they are skipped
+        digest_len = 2 * URL_HASH_SIZE
+
+        response = self.reader_table.query(**query)
+        while True:
+            for item in response.get('Items', []):
+                digest = item['sk'][4:]
+                if len(digest) == digest_len:
+                    seen.add(bytes.fromhex(digest))
+
+            # Handle pagination if needed
+            if 'LastEvaluatedKey' not in response:
+                return seen
+            response = self.reader_table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query)
+
     def filter_unseen(self, account: str, articles: List[dict]) -> List[dict]:
         """Filter out articles that have been seen before.
 
+        Only the incoming articles' keys are looked up (BatchGetItem, 100
+        keys per request), so the cost scales with the number of new
+        articles rather than with the account's history. Articles must
+        already carry a url_hash (see ArticleFilter.filter_and_dedupe);
+        while LEGACY_URL_KEY_LOOKUP is set, their links' pre-BLAKE2b-64
+        key is checked too.
+
         Args:
             account: Company/account name
             articles: List of article dictionaries
@@ -105,15 +375,199 @@ class DynamoDBPersistence:
         Returns:
             List of unseen articles
         """
-        seen_hashes = self.get_seen_urls(account)
-        unseen = []
-
+        pk = f"ACCOUNT#{account}"
+        by_sk: Dict[str, dict] = {}
         for article in articles:
-            url_hash = article.get('url_hash', '')
-            if url_hash and url_hash not in seen_hashes:
-                unseen.append(article)
+            url_hash = article.get('url_hash', b'')
+            if url_hash:
+                by_sk[f"URL#{url_hash.hex()}"] = article
+
+        # With a Bloom filter, articles it has never seen are new for sure;
+        # only the (few) possible hits need confirming in DynamoDB
+        bloom = self._get_bloom(account) if self.bloom_bucket else None
+        if bloom is not None:
+            sort_keys = [sk for sk, article in by_sk.items() if article['url_hash'] in bloom]
+        else:
+            sort_keys = list(by_sk)
+
+        # Items written before the switch to BLAKE2b-64 are keyed by a
+        # SHA-256 hash the Bloom filter doesn't hold, so those keys are
+        # always looked up, each mapped back to its article's current key
+        legacy_sks: Dict[str, str] = {}
+        if LEGACY_URL_KEY_LOOKUP:
+            for sk, article in by_sk.items():
+                digest = legacy_url_hash(article.get('link', ''))
+                if digest:
+                    legacy_sks[f"URL#{digest}"] = sk
+            sort_keys.extend(legacy_sks)
+
+        seen_sks: Set[str] = set()
+        for start in range(0, len(sort_keys), DYNAMODB_BATCH_GET_SIZE):
+            keys = [{'pk': pk, 'sk': sk} for sk in sort_keys[start:start + DYNAMODB_BATCH_GET_SIZE]]
+            seen_sks.update(legacy_sks.get(sk, sk) for sk in self._batch_get_sort_keys(keys))
+
+        return [article for sk, article in by_sk.items() if sk not in seen_sks]
+
+    def _bloom_key(self, account: str) -> str:
+        """S3 key of an account's Bloom filter."""
+        return f"{SEEN_BLOOM_PREFIX}/{quote(account, safe='')}.bin"
+
+    def _get_bloom(self, account: str) -> Optional[BloomFilter]:
+        """Load an account's Bloom filter, creating it if there is none yet.
+
+        A new filter is seeded from the account's existing history in
+        DynamoDB, so it never reports a previously seen URL as new.
 
-        return unseen
+        Args:
+            account: Company/account name
+
+        Returns:
+            BloomFilter, or None if it can't be loaded or seeded (callers
+            then check every article against DynamoDB)
+        """
+        if account in self._blooms:
+            return self._blooms[account]
+
+        s3 = get_client('s3')
+        bloom = None
+        etag = None
+        try:
+            response = s3.get_object(Bucket=self.bloom_bucket, Key=self._bloom_key(account))
+            etag = response['ETag']
+            bloom = BloomFilter.from_bytes(response['Body'].read())
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                log_with_context(
+                    logger, logging.ERROR, "Error loading seen-URL filter",
+                    account=account, bucket=self.bloom_bucket, error=str(e)
+                )
+                self._blooms[account] = None
+                return None
+        except BotoCoreError as e:
+            log_with_context(
+                logger, logging.ERROR, "Error loading seen-URL filter",
+                account=account, bucket=self.bloom_bucket, error=str(e)
+            )
+            self._blooms[account] = None
+            return None
+        except ValueError as e:
+            log_with_context(
+                logger, logging.WARNING, "Discarding corrupt seen-URL filter",
+                account=account, bucket=self.bloom_bucket, error=str(e)
+            )
+
+        self._bloom_etags[account] = etag
+        if bloom is None:
+            try:
+                history = self._query_seen_urls(account)
+            except (ClientError, BotoCoreError) as e:
+                log_with_context(
+                    logger, logging.ERROR, "Error seeding seen-URL filter",
+                    account=account, table=self.table_name, error=str(e)
+                )
+                self._blooms[account] = None
+                return None
+
+            bloom = BloomFilter.for_capacity(SEEN_BLOOM_CAPACITY, SEEN_BLOOM_ERROR_RATE)
+            for url_hash in history:
+                bloom.add(url_hash)
+
+            # The seeded filter is accurate for this run even if it can't be
+            # stored; it is just not kept for mark_as_seen to extend
+            if not self._save_bloom(account, bloom):
+                return bloom
+
+        self._blooms[account] = bloom
+        return bloom
+
+    def _save_bloom(self, account: str, bloom: BloomFilter) -> bool:
+        """Upload an account's Bloom filter.
+
+        The write is conditional on the object being unchanged since it was
+        loaded (or still absent), so concurrent runs can't overwrite each
+        other's hashes. If the upload fails for any reason the stored
+        filter may be missing hashes, so it is deleted and the next run
+        reseeds it from DynamoDB.
+
+        Args:
+            account: Company/account name
+            bloom: Filter to store
+
+        Returns:
+            True if the filter was stored
+        """
+        s3 = get_client('s3')
+        key = self._bloom_key(account)
+        etag = self._bloom_etags.get(account)
+        condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+
+        try:
+            response = s3.put_object(
+                Bucket=self.bloom_bucket,
+                Key=key,
+                Body=bloom.to_bytes(),
+                ContentType='application/octet-stream',
+                **condition
+            )
+            self._bloom_etags[account] = response['ETag']
+            return True
+        except (ClientError, BotoCoreError) as e:
+            log_with_context(
+                logger, logging.ERROR, "Error saving seen-URL filter; deleting it",
+                account=account, bucket=self.bloom_bucket, error=str(e)
+            )
+
+        # Don't extend or re-upload this filter again during the run
+        self._blooms[account] = None
+        try:
+            s3.delete_object(Bucket=self.bloom_bucket, Key=key)
+        except (ClientError, BotoCoreError) as e:
+            log_with_context(
+                logger, logging.ERROR, "Error deleting stale seen-URL filter",
+                account=account, bucket=self.bloom_bucket, key=key, error=str(e)
+            )
+        return False
+
+    def _batch_get_sort_keys(self, keys: List[Dict[str, str]]) -> Set[str]:
+        """Look up which of up to 100 keys exist in the table.
+
+        Unprocessed keys (returned when the request is throttled) are
+        retried with exponential backoff.
+
+        Args:
+            keys: Primary keys to look up
+
+        Returns:
+            Sort keys of the items that exist
+        """
+        found: Set[str] = set()
+        request = {self.table_name: {'Keys': keys, 'ProjectionExpression': 'sk'}}
+
+        try:
+            for attempt in range(DYNAMODB_BATCH_MAX_RETRIES + 1):
+                response = self.reader.batch_get_item(RequestItems=request)
+                for item in response.get('Responses', {}).get(self.table_name, []):
+                    found.add(item['sk'])
+
+                request = response.get('UnprocessedKeys')
+                if not request:
+                    return found
+                if attempt < DYNAMODB_BATCH_MAX_RETRIES:
+                    _backoff(attempt)
+
+            log_with_context(
+                logger, logging.WARNING, "Giving up on unprocessed seen-URL lookups",
+                table=self.table_name, unprocessed=len(request[self.table_name]['Keys']),
+                attempts=DYNAMODB_BATCH_MAX_RETRIES + 1
+            )
+        except (ClientError, BotoCoreError) as e:
+            log_with_context(
+                logger, logging.ERROR, "Error looking up seen URLs",
+                table=self.table_name, keys=len(keys), error=str(e)
+            )
+
+        # Keys that could not be checked are treated as unseen
+        return found
 
 
 class S3Archiver:
@@ -126,7 +580,7 @@ class S3Archiver:
             bucket_name: S3 bucket name
         """
         self.bucket_name = bucket_name
-        self.s3 = boto3.client('s3')
+        self.s3 = get_client('s3')
 
     def archive_brief(self, week_key: str, content: str) -> bool:
         """Archive a weekly brief to S3.
@@ -141,17 +595,23 @@ class S3Archiver:
         key = f"briefs/{week_key}.json"
 
         try:
-            self.s3.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=content.encode('utf-8'),
-                ContentType='application/json'
+            # Small briefs go up in a single PUT; past the multipart
+            # threshold the transfer manager uploads parts concurrently
+            self.s3.upload_fileobj(
+                io.BytesIO(content.encode('utf-8')),
+                self.bucket_name,
+                key,
+                ExtraArgs={'ContentType': 'application/json'},
+                Config=_transfer_config()
             )
-            print(f"Archived brief to s3://{self.bucket_name}/{key}")
+            logger.info("Archived brief to s3://%s/%s", self.bucket_name, key)
             return True
 
         except Exception as e:
-            print(f"Error archiving brief: {e}")
+            log_with_context(
+                logger, logging.ERROR, "Error archiving brief",
+                bucket=self.bucket_name, key=key, error=str(e)
+            )
             return False
 
     def get_brief(self, week_key: str) -> str:
@@ -165,15 +625,118 @@ class S3Archiver:
         """
         key = f"briefs/{week_key}.json"
 
+        # Large archives are fetched as concurrent byte ranges; below the
+        # threshold the extra requests cost more than they save
+        try:
+            head = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return ""
+            log_with_context(
+                logger, logging.ERROR, "Error retrieving brief",
+                bucket=self.bucket_name, key=key, error=str(e)
+            )
+            return ""
+        except BotoCoreError as e:
+            log_with_context(
+                logger, logging.ERROR, "Error retrieving brief",
+                bucket=self.bucket_name, key=key, error=str(e)
+            )
+            return ""
+
+        size = head['ContentLength']
+        if size >= S3_RANGED_GET_THRESHOLD:
+            try:
+                return self._get_ranged(key, size, head['ETag']).decode('utf-8')
+            except Exception as e:
+                log_with_context(
+                    logger, logging.ERROR, "Error retrieving brief",
+                    bucket=self.bucket_name, key=key, error=str(e)
+                )
+                return ""
+
+        stream = self.stream_brief(week_key)
+        if stream is None:
+            return ""
+
+        try:
+            return stream.read()
+        except Exception as e:
+            log_with_context(
+                logger, logging.ERROR, "Error retrieving brief",
+                bucket=self.bucket_name, key=key, error=str(e)
+            )
+            return ""
+        finally:
+            stream.close()
+
+    def stream_brief(self, week_key: str) -> Optional[TextIO]:
+        """Open a brief in S3 as a text stream.
+
+        The body is decoded incrementally as it is read, so callers that
+        parse or copy the archive piecewise never hold the whole brief in
+        memory as both bytes and str. The caller must close the stream.
+
+        Args:
+            week_key: ISO week identifier
+
+        Returns:
+            UTF-8 text stream over the brief, or None if not found
+        """
+        key = f"briefs/{week_key}.json"
+
         try:
             response = self.s3.get_object(
                 Bucket=self.bucket_name,
                 Key=key
             )
-            return response['Body'].read().decode('utf-8')
+            return codecs.getreader('utf-8')(response['Body'])
 
         except self.s3.exceptions.NoSuchKey:
-            return ""
+            return None
         except Exception as e:
-            print(f"Error retrieving brief: {e}")
-            return ""
+            log_with_context(
+                logger, logging.ERROR, "Error retrieving brief",
+                bucket=self.bucket_name, key=key, error=str(e)
+            )
+            return None
+
+    def _get_ranged(self, key: str, size: int, etag: str) -> bytearray:
+        """Download an object as concurrent byte-range GETs.
+
+        Each range is written into a buffer preallocated to the object's
+        size, so the parts are never concatenated. Every range is pinned to
+        the same ETag, so an overwrite mid-download fails the read instead
+        of mixing bytes from two versions.
+
+        Args:
+            key: S3 object key
+            size: Object size in bytes
+            etag: ETag of the version to read
+
+        Returns:
+            Object content
+        """
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+
+        def fetch(start: int) -> None:
+            end = min(start + S3_MULTIPART_CHUNKSIZE, size) - 1
+            response = self.s3.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+                IfMatch=etag
+            )
+            body = response['Body']
+            offset = start
+            for chunk in body.iter_chunks():
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+            if offset != end + 1:
+                raise IOError(f"Short read for bytes {start}-{end} of {key}")
+
+        with ThreadPoolExecutor(max_workers=S3_MAX_CONCURRENCY) as executor:
+            list(executor.map(fetch, range(0, size, S3_MULTIPART_CHUNKSIZE)))
+
+        return buffer
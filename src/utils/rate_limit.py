@@ -0,0 +1,75 @@
+"""Client-side rate limiting for outbound API calls."""
+import time
+import threading
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``refill_rate`` per second up to
+    ``capacity``. Callers either block until a token is available
+    (``acquire``) or take one only if it is there (``try_consume``).
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize the bucket full.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until the requested tokens are available, then take them.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+    def try_consume(self, tokens: float = 1) -> bool:
+        """Take tokens only if they are available right now.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken, False if the bucket is short
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def credit(self, tokens: float) -> None:
+        """Return tokens to the bucket, capped at capacity.
+
+        Args:
+            tokens: Number of tokens to add
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + tokens)
@@ -0,0 +1,81 @@
+"""On-disk cache for Claude summaries."""
+import os
+import json
+import time
+import sqlite3
+from contextlib import closing
+from typing import Dict, Optional
+
+from src.constants import SUMMARY_CACHE_TTL_DAYS
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SummaryCache:
+    """SQLite-backed cache of summaries keyed by a hash of the prompt inputs.
+
+    On Lambda the database lives in /tmp, so it survives warm invocations of
+    the same container and lets a re-run skip the Claude API entirely.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = SUMMARY_CACHE_TTL_DAYS * 24 * 3600):
+        """Initialize the summary cache.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: How long cached summaries stay valid
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection (connections are not shared across threads)."""
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a cached summary.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached summary dictionary, or None on a miss or expired entry
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM summaries WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Summary cache read failed: {e}")
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store a summary.
+
+        Args:
+            key: Cache key
+            value: Summary dictionary
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + self.ttl_seconds)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Summary cache write failed: {e}")
@@ -0,0 +1,26 @@
+"""Unit tests for article URL canonicalization."""
+import hashlib
+
+import pytest
+
+from src.utils.article_filter import _canonicalize_url, legacy_url_hash
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('', ''),
+    ('https://acme.com/news', 'https://acme.com/news'),
+    ('https://acme.com/news#top', 'https://acme.com/news'),
+    ('https://acme.com/news?utm_source=x&UTM_MEDIUM=y', 'https://acme.com/news'),
+    ('https://acme.com/news?id=7&utm_source=x&page=2', 'https://acme.com/news?id=7&page=2'),
+    ('https://acme.com/news?q=a%20b&fbclid=1#frag', 'https://acme.com/news?q=a%20b'),
+    ('https://acme.com/news?&id=7&', 'https://acme.com/news?id=7'),
+])
+def test_canonicalize_url(url, expected):
+    assert _canonicalize_url(url) == expected
+
+
+def test_legacy_url_hash_matches_old_keys():
+    expected = hashlib.sha256(b'https://acme.com/news?q=a+b').hexdigest()
+
+    assert legacy_url_hash('https://acme.com/news?q=a%20b&utm_source=x#top') == expected
+    assert legacy_url_hash('') == ''
@@ -0,0 +1,51 @@
+"""Unit tests for the seen-URL Bloom filter."""
+import hashlib
+
+import pytest
+
+from src.utils.bloom import BloomFilter
+
+
+def _digest(i: int) -> bytes:
+    return hashlib.blake2b(str(i).encode(), digest_size=8).digest()
+
+
+def test_added_digests_are_members():
+    bloom = BloomFilter.for_capacity(1000, 0.01)
+    digests = [_digest(i) for i in range(1000)]
+    for digest in digests:
+        bloom.add(digest)
+
+    assert all(digest in bloom for digest in digests)
+
+
+def test_false_positive_rate_near_target():
+    bloom = BloomFilter.for_capacity(1000, 0.01)
+    for i in range(1000):
+        bloom.add(_digest(i))
+
+    false_positives = sum(_digest(i) in bloom for i in range(1000, 11000))
+    assert false_positives < 300
+
+
+def test_round_trip():
+    bloom = BloomFilter.for_capacity(100, 0.01)
+    bloom.add(_digest(1))
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert (restored.num_bits, restored.num_hashes) == (bloom.num_bits, bloom.num_hashes)
+    assert _digest(1) in restored
+
+
+@pytest.mark.parametrize('data', [b'', b'\x00' * 4])
+def test_from_bytes_rejects_truncated_header(data):
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(data)
+
+
+def test_from_bytes_rejects_size_mismatch():
+    data = BloomFilter.for_capacity(100, 0.01).to_bytes()
+
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(data[:-1])
@@ -0,0 +1,72 @@
+"""Unit tests for the Newsdata.io client."""
+from unittest import mock
+
+import pytest
+
+from src.clients import newsdata_client
+from src.clients.newsdata_client import NewsdataClient
+
+
+@pytest.fixture
+def client():
+    """Client whose connection pool is a stub (no network access)."""
+    with mock.patch.object(NewsdataClient, '_prewarm'):
+        client = NewsdataClient('test-key')
+    client._pool = mock.Mock()
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize('status', [401, 403, 404])
+def test_client_errors_fail_fast(client, status):
+    """Non-retryable 4xx responses return None after a single request."""
+    client._pool.request.return_value = mock.Mock(status=status, data=b'{"status": "error"}')
+
+    with mock.patch.object(newsdata_client.time, 'sleep') as sleep, \
+            mock.patch('src.utils.rate_limit.time.sleep') as bucket_sleep:
+        result = client._make_request({'q': f'client-error-{status}'})
+
+    assert result is None
+    assert client._pool.request.call_count == 1
+    sleep.assert_not_called()
+    bucket_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize('status', [401, 403, 404])
+def test_retry_policy_skips_client_errors(status):
+    """The pool's retry policy never retries non-retryable 4xx responses."""
+    with mock.patch.object(NewsdataClient, '_prewarm'):
+        client = NewsdataClient('test-key')
+    try:
+        assert not client._pool.retries.is_retry('GET', status)
+        assert client._pool.retries.is_retry('GET', 429)
+    finally:
+        client.close()
+
+
+def test_batch_matching_survives_unicode_case_folding(client):
+    """Names matched via Unicode case folding are still assigned."""
+    companies = ['Sonos', 'Meta', 'Meta Platforms']
+    client._paginated_fetch = mock.Mock(return_value=[
+        {'title': 'ſonos and Meta Platforms', 'link': 'https://example.com/1'},
+        {'title': 'meta earnings', 'link': 'https://example.com/2'},
+    ])
+    dedupers = {company: newsdata_client._UrlDeduper() for company in companies}
+
+    matched = client._fetch_direct_mentions_batch(companies, '2024-01-01', '2024-01-08', 5, dedupers)
+
+    assert [a['link'] for a in matched['Sonos']] == ['https://example.com/1']
+    assert [a['link'] for a in matched['Meta Platforms']] == ['https://example.com/1']
+    assert [a['link'] for a in matched['Meta']] == ['https://example.com/2']
+
+
+def test_paginated_fetch_leaves_overshoot_unclaimed(client):
+    """Articles trimmed past max_results stay available to other strategies."""
+    page = [{'link': f'https://example.com/{i}'} for i in range(5)]
+    client._make_request = mock.Mock(return_value={'status': 'success', 'results': page})
+    deduper = newsdata_client._UrlDeduper()
+
+    articles = client._paginated_fetch({'q': 'acme'}, 2, deduper=deduper)
+
+    assert articles == page[:2]
+    assert deduper.claim(page) == page[2:]
@@ -0,0 +1,56 @@
+"""Unit tests for the token bucket rate limiter."""
+from unittest import mock
+
+import pytest
+
+from src.utils.rate_limit import TokenBucket
+
+
+@pytest.mark.parametrize('capacity, refill_rate', [(0, 1), (1, 0), (-1, 1)])
+def test_rejects_non_positive_arguments(capacity, refill_rate):
+    with pytest.raises(ValueError):
+        TokenBucket(capacity, refill_rate)
+
+
+def test_try_consume_stops_at_capacity():
+    with mock.patch('src.utils.rate_limit.time.monotonic', return_value=0.0):
+        bucket = TokenBucket(2, 1)
+
+        assert bucket.try_consume()
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+
+
+def test_refills_over_time():
+    clock = mock.Mock(return_value=0.0)
+    with mock.patch('src.utils.rate_limit.time.monotonic', clock):
+        bucket = TokenBucket(1, 2)
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+
+        clock.return_value = 0.5
+        assert bucket.try_consume()
+
+
+def test_credit_is_capped_at_capacity():
+    with mock.patch('src.utils.rate_limit.time.monotonic', return_value=0.0):
+        bucket = TokenBucket(2, 1)
+        bucket.try_consume()
+        bucket.credit(5)
+
+        assert bucket.tokens == 2
+
+
+def test_acquire_sleeps_until_a_token_refills():
+    clock = mock.Mock(return_value=0.0)
+
+    def sleep(seconds):
+        clock.return_value += seconds
+
+    with mock.patch('src.utils.rate_limit.time.monotonic', clock), \
+            mock.patch('src.utils.rate_limit.time.sleep', side_effect=sleep) as sleeper:
+        bucket = TokenBucket(1, 4)
+        bucket.acquire()
+        bucket.acquire()
+
+    sleeper.assert_called_once_with(0.25)